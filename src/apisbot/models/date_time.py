@@ -23,12 +23,14 @@ class DateTimeData:
 
     def __post_init__(self) -> None:
         """Validate date constraints and set display formats."""
+        today = date.today()
+
         # Validate date is not in the future
-        if self.birth_date > date.today():
+        if self.birth_date > today:
             raise ValueError("Birth date cannot be in the future")
 
         # Validate date is not unreasonably old (e.g., > 200 years ago)
-        min_year = date.today().year - 200
+        min_year = today.year - 200
         if self.birth_date.year < min_year:
             raise ValueError(f"Birth date must be after year {min_year}")
 
@@ -3,11 +3,16 @@
 Framework-agnostic service with no aiogram dependencies.
 """
 
-from typing import List
+from typing import Dict, List, Tuple
 
 from ..models.chart_selection import ChartSelection
 from ..models.errors import ValidationError
 
+# Enum values are already lowercase, so a lowercased input is looked up directly
+_CHART_TYPES_BY_VALUE: Dict[str, ChartSelection] = {ct.value: ct for ct in ChartSelection}
+_AVAILABLE_CHART_TYPES = ", ".join(_CHART_TYPES_BY_VALUE)
+_AVAILABLE_CHARTS: Tuple[ChartSelection, ...] = tuple(ChartSelection)
+
 
 class ChartSelectionService:
     """Service for handling chart type selection.
@@ -54,23 +59,22 @@ class ChartSelectionService:
         Returns:
             ChartSelection if valid, ValidationError if invalid
         """
-        try:
-            # Try to parse as ChartSelection enum
-            return ChartSelection(chart_type.lower())
-        except ValueError:
-            available_types = [ct.value for ct in ChartSelection]
-            return ValidationError(
-                field_name="chart_type",
-                message=f"Unknown chart type: {chart_type}",
-                remediation=f"Available chart types: {', '.join(available_types)}",
-                user_input=chart_type,
-            )
+        selection = _CHART_TYPES_BY_VALUE.get(chart_type.lower())
+        if selection is not None:
+            return selection
+
+        return ValidationError(
+            field_name="chart_type",
+            message=f"Unknown chart type: {chart_type}",
+            remediation=f"Available chart types: {_AVAILABLE_CHART_TYPES}",
+            user_input=chart_type,
+        )
 
     @staticmethod
     def get_available_charts() -> List[ChartSelection]:
         """Get list of available chart types.
 
         Returns:
-            List of all available ChartSelection types
+            List of all available ChartSelection types (a fresh copy the caller may modify)
         """
-        return list(ChartSelection)
+        return list(_AVAILABLE_CHARTS)
@@ -1,7 +1,5 @@
 import logging
 
-import cairosvg
-
 logger = logging.getLogger(__name__)
 
 
@@ -29,6 +27,10 @@ class ConverterService:
         Raises:
             ValueError: If conversion fails or resulting PNG is too large
         """
+        # Imported here so that loading the services package does not pull in the cairo bindings.
+        # Kept outside the try: a missing libcairo is an environment error, not a failed conversion.
+        import cairosvg
+
         try:
             logger.info("Converting SVG to PNG")
 
@@ -1,5 +1,15 @@
 import re
-from datetime import date, time, timedelta
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+
+# Compiled once at import; parse_date and parse_time run on every date/time message
+_YMD_PATTERN = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})$")
+_DMY_PATTERN = re.compile(r"^(\d{1,2})[/-](\d{1,2})[/-](\d{4})$")
+_MONTH_DAY_YEAR_PATTERN = re.compile(r"^[A-Za-z]+\s+\d{1,2},?\s+\d{4}$")
+_DAY_MONTH_YEAR_PATTERN = re.compile(r"^\d{1,2}\s+[A-Za-z]+\s+\d{4}$")
+
+_HOUR_ONLY_PATTERN = re.compile(r"^\d{1,2}$")
+_TIME_12H_PATTERN = re.compile(r"^(\d{1,2})(?::(\d{2}))?\s*([AP]M)$", re.IGNORECASE)
 
 
 def parse_date(date_str: str) -> date:
@@ -21,48 +31,84 @@ def parse_date(date_str: str) -> date:
     Raises:
         ValueError: If date format is invalid or date is out of valid range
     """
-    date_str = date_str.strip()
+    parsed_date = _parse_date_text(date_str.strip())
 
-    # Try YYYY-MM-DD format
-    if re.match(r"^\d{4}-\d{1,2}-\d{1,2}$", date_str):
-        parts = date_str.split("-")
-        parsed_date = date(int(parts[0]), int(parts[1]), int(parts[2]))
+    # Validate range (200 years ago to today)
+    today = date.today()
 
-    # Try DD/MM/YYYY or DD-MM-YYYY format
-    elif re.match(r"^\d{1,2}[/-]\d{1,2}[/-]\d{4}$", date_str):
-        parts = re.split(r"[/-]", date_str)
-        parsed_date = date(int(parts[2]), int(parts[1]), int(parts[0]))
+    if parsed_date > today:
+        raise ValueError("Birth date cannot be in the future")
 
-    # Try "Month DD, YYYY" format
-    elif re.match(r"^[A-Za-z]+\s+\d{1,2},?\s+\d{4}$", date_str):
-        # Use strptime for month name parsing
-        from datetime import datetime
+    if parsed_date < today - timedelta(days=200 * 365):
+        raise ValueError("Birth date cannot be more than 200 years ago")
 
-        parsed_date = datetime.strptime(date_str.replace(",", ""), "%B %d %Y").date()
+    return parsed_date
 
-    # Try "DD Month YYYY" format
-    elif re.match(r"^\d{1,2}\s+[A-Za-z]+\s+\d{4}$", date_str):
-        from datetime import datetime
 
-        parsed_date = datetime.strptime(date_str, "%d %B %Y").date()
+@lru_cache(maxsize=1024)
+def _parse_date_text(date_str: str) -> date:
+    """Parse a stripped date string in any supported format, without the range check.
 
-    else:
-        raise ValueError(
-            "Invalid date format. Please use one of: YYYY-MM-DD, DD/MM/YYYY, "
-            "or 'Month DD, YYYY' (e.g., '1990-05-15' or 'May 15, 1990')"
-        )
+    Cached because the result depends only on the text; the range check depends
+    on today's date and is applied by parse_date on every call.
+    """
+    # Most input is one of the zero-padded numeric forms; only probe the patterns when it is not
+    parsed_date = _parse_fixed_width_date(date_str)
+    if parsed_date is None:
+        parsed_date = _parse_date_patterns(date_str)
 
-    # Validate range (200 years ago to today)
-    today = date.today()
-    min_date = today - timedelta(days=200 * 365)
+    return parsed_date
 
-    if parsed_date > today:
-        raise ValueError("Birth date cannot be in the future")
 
-    if parsed_date < min_date:
-        raise ValueError("Birth date cannot be more than 200 years ago")
+def _parse_fixed_width_date(date_str: str) -> date | None:
+    """Parse zero-padded YYYY-MM-DD, DD/MM/YYYY and DD-MM-YYYY without regex or strptime.
 
-    return parsed_date
+    Returns None for anything else, including impossible dates, so the caller
+    can fall back to the general patterns and their error messages.
+    """
+    if len(date_str) != 10:
+        return None
+
+    try:
+        if date_str[4] == "-" and date_str[7] == "-":
+            return date.fromisoformat(date_str)
+
+        if date_str[2] in "/-" and date_str[5] in "/-":
+            day, month, year = date_str[0:2], date_str[3:5], date_str[6:10]
+            if day.isdecimal() and month.isdecimal() and year.isdecimal():
+                return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+    return None
+
+
+def _parse_date_patterns(date_str: str) -> date:
+    """Parse the formats accepted by parse_date by matching each pattern in turn."""
+    # Try YYYY-MM-DD format
+    match = _YMD_PATTERN.match(date_str)
+    if match:
+        year, month, day = match.groups()
+        return date(int(year), int(month), int(day))
+
+    # Try DD/MM/YYYY or DD-MM-YYYY format
+    match = _DMY_PATTERN.match(date_str)
+    if match:
+        day, month, year = match.groups()
+        return date(int(year), int(month), int(day))
+
+    # Try "Month DD, YYYY" format (strptime handles the month name)
+    if _MONTH_DAY_YEAR_PATTERN.match(date_str):
+        return datetime.strptime(date_str.replace(",", ""), "%B %d %Y").date()
+
+    # Try "DD Month YYYY" format
+    if _DAY_MONTH_YEAR_PATTERN.match(date_str):
+        return datetime.strptime(date_str, "%d %B %Y").date()
+
+    raise ValueError(
+        "Invalid date format. Please use one of: YYYY-MM-DD, DD/MM/YYYY, "
+        "or 'Month DD, YYYY' (e.g., '1990-05-15' or 'May 15, 1990')"
+    )
 
 
 def parse_time(time_str: str) -> time:
@@ -83,12 +129,22 @@ def parse_time(time_str: str) -> time:
     Raises:
         ValueError: If time format is invalid
     """
-    time_str = time_str.strip()
-
-    # Try 24-hour format HH:MM
-    if re.match(r"^\d{1,2}:\d{2}$", time_str):
-        parts = time_str.split(":")
-        hour, minute = int(parts[0]), int(parts[1])
+    return _parse_time_text(time_str.strip())
+
+
+@lru_cache(maxsize=1024)
+def _parse_time_text(time_str: str) -> time:
+    """Parse a stripped time string in any supported format; cached as the result depends only on the text."""
+    # Try 24-hour format H:MM / HH:MM (split directly; cheaper than a regex for this grammar)
+    hour_text, separator, minute_text = time_str.partition(":")
+    if (
+        separator
+        and 1 <= len(hour_text) <= 2
+        and len(minute_text) == 2
+        and hour_text.isdecimal()
+        and minute_text.isdecimal()
+    ):
+        hour, minute = int(hour_text), int(minute_text)
 
         if not (0 <= hour <= 23 and 0 <= minute <= 59):
             raise ValueError("Invalid time: hours must be 0-23, minutes must be 0-59")
@@ -96,7 +152,7 @@ def parse_time(time_str: str) -> time:
         return time(hour, minute)
 
     # Try hour only (24-hour)
-    elif re.match(r"^\d{1,2}$", time_str):
+    if _HOUR_ONLY_PATTERN.match(time_str):
         hour = int(time_str)
 
         if not (0 <= hour <= 23):
@@ -105,12 +161,8 @@ def parse_time(time_str: str) -> time:
         return time(hour, 0)
 
     # Try 12-hour format with AM/PM
-    elif re.match(r"^\d{1,2}(:\d{2})?\s*[AaPp][Mm]$", time_str, re.IGNORECASE):
-        # Extract hour, minute, and AM/PM
-        match = re.match(r"^(\d{1,2})(?::(\d{2}))?\s*([AaPp][Mm])$", time_str, re.IGNORECASE)
-        if not match:
-            raise ValueError("Invalid time format")
-
+    match = _TIME_12H_PATTERN.match(time_str)
+    if match:
         hour = int(match.group(1))
         minute = int(match.group(2)) if match.group(2) else 0
         period = match.group(3).upper()
@@ -127,11 +179,10 @@ def parse_time(time_str: str) -> time:
 
         return time(hour, minute)
 
-    else:
-        raise ValueError(
-            "Invalid time format. Please use one of: HH:MM (24-hour), "
-            "HH (hour only), or HH:MM AM/PM (12-hour). Examples: '14:30', '14', '2:30 PM'"
-        )
+    raise ValueError(
+        "Invalid time format. Please use one of: HH:MM (24-hour), "
+        "HH (hour only), or HH:MM AM/PM (12-hour). Examples: '14:30', '14', '2:30 PM'"
+    )
 
 
 def suggest_date_format(invalid_input: str) -> str:
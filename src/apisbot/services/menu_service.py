@@ -4,7 +4,7 @@ Framework-agnostic service with no aiogram dependencies.
 Provides user-friendly command hints at each conversation step.
 """
 
-from typing import List
+from typing import Dict, List, Tuple
 
 from ..models.chart_selection import ChartSelection
 
@@ -18,6 +18,45 @@ class MenuService:
     No aiogram dependencies: Fully testable without bot infrastructure.
     """
 
+    # Shared by every call; get_state_hints returns a fresh list so callers cannot alter these
+    _STATE_HINTS: Dict[str, Tuple[str, ...]] = {
+        "chart_selection": (
+            "Choose chart type from the menu above",
+            "/help - Learn about chart types",
+            "/cancel - Cancel and start over",
+        ),
+        "name_entry": (
+            "Enter the person's name (1-100 characters)",
+            "Example: John Doe",
+            "/cancel - Cancel chart generation",
+        ),
+        "date_entry": (
+            "Enter birth date in one of these formats:",
+            "  • DD.MM.YYYY (e.g., 15.05.1990)",
+            "  • YYYY-MM-DD (e.g., 1990-05-15)",
+            "  • Month DD, YYYY (e.g., May 15, 1990)",
+            "/cancel - Cancel chart generation",
+        ),
+        "time_entry": (
+            "Enter birth time in 24-hour format:",
+            "  • HH:MM (e.g., 14:30 for 2:30 PM)",
+            "  • HH:MM AM/PM (e.g., 2:30 PM)",
+            "/cancel - Cancel chart generation",
+        ),
+        "location_entry": (
+            "Enter birth location (city name):",
+            "  • Include country for accuracy (e.g., London, UK)",
+            "  • Use major cities if your town is small",
+            "Example: New York, USA",
+            "/cancel - Cancel chart generation",
+        ),
+        "generating": (
+            "⏳ Generating your chart...",
+            "This may take a few moments.",
+        ),
+    }
+    _DEFAULT_HINTS: Tuple[str, ...] = ("/help - Get help", "/cancel - Cancel")
+
     @staticmethod
     def get_start_menu_text() -> str:
         """Get welcome text and chart selection menu for /start command.
@@ -45,44 +84,7 @@ class MenuService:
         Returns:
             List of command hints for display
         """
-        hints_map = {
-            "chart_selection": [
-                "Choose chart type from the menu above",
-                "/help - Learn about chart types",
-                "/cancel - Cancel and start over",
-            ],
-            "name_entry": [
-                "Enter the person's name (1-100 characters)",
-                "Example: John Doe",
-                "/cancel - Cancel chart generation",
-            ],
-            "date_entry": [
-                "Enter birth date in one of these formats:",
-                "  • DD.MM.YYYY (e.g., 15.05.1990)",
-                "  • YYYY-MM-DD (e.g., 1990-05-15)",
-                "  • Month DD, YYYY (e.g., May 15, 1990)",
-                "/cancel - Cancel chart generation",
-            ],
-            "time_entry": [
-                "Enter birth time in 24-hour format:",
-                "  • HH:MM (e.g., 14:30 for 2:30 PM)",
-                "  • HH:MM AM/PM (e.g., 2:30 PM)",
-                "/cancel - Cancel chart generation",
-            ],
-            "location_entry": [
-                "Enter birth location (city name):",
-                "  • Include country for accuracy (e.g., London, UK)",
-                "  • Use major cities if your town is small",
-                "Example: New York, USA",
-                "/cancel - Cancel chart generation",
-            ],
-            "generating": [
-                "⏳ Generating your chart...",
-                "This may take a few moments.",
-            ],
-        }
-
-        return hints_map.get(state, ["/help - Get help", "/cancel - Cancel"])
+        return list(MenuService._STATE_HINTS.get(state, MenuService._DEFAULT_HINTS))
 
     @staticmethod
     def get_help_documentation() -> str:
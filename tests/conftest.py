@@ -1,6 +1,32 @@
 """Pytest configuration for tests."""
 
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
+from aiogram.fsm.context import FSMContext
+from aiogram.types import Message, User
+
+TEST_USER = User(id=123, is_bot=False, first_name="Test")
+
+
+class FastAsync:
+    """Awaitable stub that records its calls without AsyncMock's bookkeeping."""
+
+    def __init__(self, ret=None):
+        self.ret = ret
+        self.calls = []
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.ret
+
+
+class ProgressMessage:
+    """Stand-in for the progress message a location handler deletes once the chart is sent."""
+
+    async def delete(self):
+        pass
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -12,3 +38,63 @@ def socket_allow_unix():
     pytest_socket.socket_allow_hosts(["localhost", "127.0.0.1"])
     # Enable unix sockets for async event loops
     pytest_socket.disable_socket(allow_unix_socket=True)
+
+
+@pytest.fixture(scope="session")
+def test_user():
+    """The shared Telegram user that sends every test message."""
+    return TEST_USER
+
+
+@pytest.fixture(scope="session")
+def message_spec():
+    """Attribute names of aiogram's Message, introspected once per session."""
+    return dir(Message)
+
+
+@pytest.fixture
+def message_factory(message_spec):
+    """Build Message doubles with the given text, sent by the shared test user."""
+
+    def make(text=None, **attrs):
+        attrs.setdefault("from_user", TEST_USER)
+        attrs.setdefault("answer", AsyncMock())
+        return MagicMock(spec=message_spec, text=text, **attrs)
+
+    return make
+
+
+@pytest.fixture
+def state_factory():
+    """Build FSMContext doubles configured with the given attributes.
+
+    Specced on the class so every coroutine method (update_data, set_state,
+    get_data, clear, ...) is an AsyncMock created lazily on first access.
+    """
+
+    def make(**attrs):
+        return MagicMock(spec=FSMContext, **attrs)
+
+    return make
+
+
+@pytest.fixture
+def fast_async():
+    """Fresh FastAsync stub for a handler-facing coroutine such as Message.answer."""
+    return FastAsync()
+
+
+@pytest.fixture
+def progress_message():
+    """Progress message double for Message.answer to return in the location handlers."""
+    return ProgressMessage()
+
+
+@pytest.fixture
+def fake_state():
+    """FSMContext stand-in whose coroutine methods are FastAsync stubs.
+
+    Cheaper than a specced MagicMock for tests that only check which state
+    calls were made; reconfigure get_data.ret to hand the handler stored data.
+    """
+    return SimpleNamespace(update_data=FastAsync(), set_state=FastAsync(), get_data=FastAsync({}), clear=FastAsync())
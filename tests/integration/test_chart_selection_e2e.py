@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from aiogram.fsm.context import FSMContext
-from aiogram.types import CallbackQuery, Message, User
+from aiogram.types import CallbackQuery, Message
 
 from apisbot.bot.handlers.start import cmd_start, handle_chart_selection
 from apisbot.bot.states import ChartFlow, CompositeFlow
@@ -20,13 +20,13 @@ class TestChartSelectionFlowE2E:
 
     @pytest.mark.asyncio
     @patch("apisbot.bot.handlers.start.session_service")
-    async def test_user_sends_start_and_sees_natal_button(self, mock_session_service):
+    async def test_user_sends_start_and_sees_natal_button(self, mock_session_service, test_user):
         """Test /start displays Natal Chart button."""
         # Arrange
         mock_session_service.clear_session = AsyncMock()
 
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.answer = AsyncMock()
 
         state = MagicMock(spec=FSMContext)
@@ -52,13 +52,13 @@ class TestChartSelectionFlowE2E:
 
     @pytest.mark.asyncio
     @patch("apisbot.bot.handlers.start.session_service")
-    async def test_user_sends_start_and_sees_composite_button(self, mock_session_service):
+    async def test_user_sends_start_and_sees_composite_button(self, mock_session_service, test_user):
         """Test /start displays Composite Chart button."""
         # Arrange
         mock_session_service.clear_session = AsyncMock()
 
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.answer = AsyncMock()
 
         state = MagicMock(spec=FSMContext)
@@ -84,7 +84,7 @@ class TestChartSelectionFlowE2E:
 
     @pytest.mark.asyncio
     @patch("apisbot.bot.handlers.start.session_service")
-    async def test_clicking_natal_button_starts_natal_flow(self, mock_session_service):
+    async def test_clicking_natal_button_starts_natal_flow(self, mock_session_service, test_user):
         """Test clicking Natal Chart button transitions to natal flow."""
         # Arrange
         from apisbot.models.session import UserSession
@@ -93,7 +93,7 @@ class TestChartSelectionFlowE2E:
         mock_session_service.get_or_create_session = AsyncMock(return_value=mock_session)
 
         callback = MagicMock(spec=CallbackQuery)
-        callback.from_user = User(id=123, is_bot=False, first_name="Test")
+        callback.from_user = test_user
         callback.data = f"chart_select:{ChartSelection.NATAL.value}"
         callback.message = MagicMock()
         callback.message.edit_text = AsyncMock()
@@ -115,7 +115,7 @@ class TestChartSelectionFlowE2E:
 
     @pytest.mark.asyncio
     @patch("apisbot.bot.handlers.start.session_service")
-    async def test_clicking_composite_button_starts_composite_flow(self, mock_session_service):
+    async def test_clicking_composite_button_starts_composite_flow(self, mock_session_service, test_user):
         """Test clicking Composite Chart button transitions to composite flow."""
         # Arrange
         from apisbot.models.session import UserSession
@@ -124,7 +124,7 @@ class TestChartSelectionFlowE2E:
         mock_session_service.get_or_create_session = AsyncMock(return_value=mock_session)
 
         callback = MagicMock(spec=CallbackQuery)
-        callback.from_user = User(id=123, is_bot=False, first_name="Test")
+        callback.from_user = test_user
         callback.data = f"chart_select:{ChartSelection.COMPOSITE.value}"
         callback.message = MagicMock()
         callback.message.edit_text = AsyncMock()
@@ -146,7 +146,7 @@ class TestChartSelectionFlowE2E:
 
     @pytest.mark.asyncio
     @patch("apisbot.bot.handlers.start.session_service")
-    async def test_chart_selection_stores_choice_in_session(self, mock_session_service):
+    async def test_chart_selection_stores_choice_in_session(self, mock_session_service, test_user):
         """Test chart selection stores the choice in user session."""
         # Arrange
         from apisbot.models.session import UserSession
@@ -155,7 +155,7 @@ class TestChartSelectionFlowE2E:
         mock_session_service.get_or_create_session = AsyncMock(return_value=mock_session)
 
         callback = MagicMock(spec=CallbackQuery)
-        callback.from_user = User(id=123, is_bot=False, first_name="Test")
+        callback.from_user = test_user
         callback.data = f"chart_select:{ChartSelection.NATAL.value}"
         callback.message = MagicMock()
         callback.message.edit_text = AsyncMock()
@@ -179,7 +179,7 @@ class TestChartSelectionErrorHandling:
 
     @pytest.mark.asyncio
     @patch("apisbot.bot.handlers.start.session_service")
-    async def test_invalid_chart_type_shows_error(self, mock_session_service):
+    async def test_invalid_chart_type_shows_error(self, mock_session_service, test_user):
         """Test invalid chart type shows error to user."""
         # Arrange
         from apisbot.models.session import UserSession
@@ -188,7 +188,7 @@ class TestChartSelectionErrorHandling:
         mock_session_service.get_or_create_session = AsyncMock(return_value=mock_session)
 
         callback = MagicMock(spec=CallbackQuery)
-        callback.from_user = User(id=123, is_bot=False, first_name="Test")
+        callback.from_user = test_user
         callback.data = "chart_select:invalid_type"
         callback.message = MagicMock()
         callback.message.edit_text = AsyncMock()
@@ -209,11 +209,11 @@ class TestChartSelectionErrorHandling:
 
     @pytest.mark.asyncio
     @patch("apisbot.bot.handlers.start.session_service")
-    async def test_missing_callback_data_handled_gracefully(self, mock_session_service):
+    async def test_missing_callback_data_handled_gracefully(self, mock_session_service, test_user):
         """Test missing callback data is handled gracefully."""
         # Arrange
         callback = MagicMock(spec=CallbackQuery)
-        callback.from_user = User(id=123, is_bot=False, first_name="Test")
+        callback.from_user = test_user
         callback.data = None
         callback.answer = AsyncMock()
 
@@ -231,7 +231,7 @@ class TestChartSelectionUserExperience:
 
     @pytest.mark.asyncio
     @patch("apisbot.bot.handlers.start.session_service")
-    async def test_natal_selection_shows_required_information(self, mock_session_service):
+    async def test_natal_selection_shows_required_information(self, mock_session_service, test_user):
         """Test natal selection shows what information is needed."""
         # Arrange
         from apisbot.models.session import UserSession
@@ -240,7 +240,7 @@ class TestChartSelectionUserExperience:
         mock_session_service.get_or_create_session = AsyncMock(return_value=mock_session)
 
         callback = MagicMock(spec=CallbackQuery)
-        callback.from_user = User(id=123, is_bot=False, first_name="Test")
+        callback.from_user = test_user
         callback.data = f"chart_select:{ChartSelection.NATAL.value}"
         callback.message = MagicMock()
         callback.message.edit_text = AsyncMock()
@@ -261,7 +261,7 @@ class TestChartSelectionUserExperience:
 
     @pytest.mark.asyncio
     @patch("apisbot.bot.handlers.start.session_service")
-    async def test_composite_selection_shows_two_people_needed(self, mock_session_service):
+    async def test_composite_selection_shows_two_people_needed(self, mock_session_service, test_user):
         """Test composite selection clarifies two people's data is needed."""
         # Arrange
         from apisbot.models.session import UserSession
@@ -270,7 +270,7 @@ class TestChartSelectionUserExperience:
         mock_session_service.get_or_create_session = AsyncMock(return_value=mock_session)
 
         callback = MagicMock(spec=CallbackQuery)
-        callback.from_user = User(id=123, is_bot=False, first_name="Test")
+        callback.from_user = test_user
         callback.data = f"chart_select:{ChartSelection.COMPOSITE.value}"
         callback.message = MagicMock()
         callback.message.edit_text = AsyncMock()
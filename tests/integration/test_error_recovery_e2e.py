@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from aiogram.fsm.context import FSMContext
-from aiogram.types import Message, User
+from aiogram.types import Message
 
 from apisbot.bot.handlers.chart_flow import process_date, process_location, process_name, process_time
 
@@ -17,11 +17,11 @@ class TestErrorRecoveryWithDataPreservation:
     """Test error recovery preserves previously entered valid data."""
 
     @pytest.mark.asyncio
-    async def test_invalid_time_preserves_valid_name_and_date(self):
+    async def test_invalid_time_preserves_valid_name_and_date(self, test_user):
         """Test invalid time input preserves previously entered name and date."""
         # Arrange
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.text = "25:99"  # Invalid time
         message.answer = AsyncMock()
 
@@ -50,11 +50,11 @@ class TestErrorRecoveryWithDataPreservation:
         state.update_data.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_invalid_location_preserves_all_previous_data(self):
+    async def test_invalid_location_preserves_all_previous_data(self, test_user):
         """Test invalid location preserves name, date, and time."""
         # Arrange
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.text = "xyznotarealcity123456"  # Invalid location
         message.answer = AsyncMock()
 
@@ -79,11 +79,11 @@ class TestErrorRecoveryWithDataPreservation:
         state.set_state.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_valid_input_after_error_continues_flow(self):
+    async def test_valid_input_after_error_continues_flow(self, test_user):
         """Test valid input after error allows flow to continue."""
         # Arrange - first try with invalid date
         message_invalid = MagicMock(spec=Message)
-        message_invalid.from_user = User(id=123, is_bot=False, first_name="Test")
+        message_invalid.from_user = test_user
         message_invalid.text = "invalid-date"
         message_invalid.answer = AsyncMock()
 
@@ -109,11 +109,11 @@ class TestErrorMessagesWithRemediation:
     """Test error messages include helpful remediation guidance."""
 
     @pytest.mark.asyncio
-    async def test_invalid_date_shows_format_examples(self):
+    async def test_invalid_date_shows_format_examples(self, test_user):
         """Test invalid date error includes format examples."""
         # Arrange
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.text = "bad-format"
         message.answer = AsyncMock()
 
@@ -132,11 +132,11 @@ class TestErrorMessagesWithRemediation:
         assert len(error_message) > 20  # Substantial error message
 
     @pytest.mark.asyncio
-    async def test_invalid_time_shows_format_examples(self):
+    async def test_invalid_time_shows_format_examples(self, test_user):
         """Test invalid time error includes format examples."""
         # Arrange
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.text = "bad-time"
         message.answer = AsyncMock()
 
@@ -157,11 +157,11 @@ class TestMultipleErrorRecovery:
     """Test multiple consecutive errors don't lose data."""
 
     @pytest.mark.asyncio
-    async def test_multiple_invalid_inputs_preserve_valid_data(self):
+    async def test_multiple_invalid_inputs_preserve_valid_data(self, test_user):
         """Test multiple invalid inputs in a row still preserve valid data."""
         # Arrange
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.answer = AsyncMock()
 
         state = MagicMock(spec=FSMContext)
@@ -183,7 +183,7 @@ class TestMultipleErrorRecovery:
 
         # Act - second invalid time with new mock
         message2 = MagicMock(spec=Message)
-        message2.from_user = User(id=123, is_bot=False, first_name="Test")
+        message2.from_user = test_user
         message2.text = "invalid"
         message2.answer = AsyncMock()
 
@@ -199,11 +199,11 @@ class TestEmptyInputHandling:
     """Test empty inputs are handled gracefully."""
 
     @pytest.mark.asyncio
-    async def test_empty_name_shows_error(self):
+    async def test_empty_name_shows_error(self, test_user):
         """Test empty name input shows appropriate error."""
         # Arrange
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.text = "   "  # Whitespace only
         message.answer = AsyncMock()
 
@@ -221,11 +221,11 @@ class TestEmptyInputHandling:
         state.set_state.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_empty_date_shows_error(self):
+    async def test_empty_date_shows_error(self, test_user):
         """Test empty date input shows appropriate error."""
         # Arrange
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.text = ""
         message.answer = AsyncMock()
 
@@ -244,11 +244,11 @@ class TestNoMessageText:
     """Test handlers gracefully handle messages without text."""
 
     @pytest.mark.asyncio
-    async def test_none_message_text_for_name(self):
+    async def test_none_message_text_for_name(self, test_user):
         """Test None message text is handled for name input."""
         # Arrange
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.text = None
         message.answer = AsyncMock()
 
@@ -264,11 +264,11 @@ class TestNoMessageText:
         assert "❌" in error_message
 
     @pytest.mark.asyncio
-    async def test_none_message_text_for_date(self):
+    async def test_none_message_text_for_date(self, test_user):
         """Test None message text is handled for date input."""
         # Arrange
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.text = None
         message.answer = AsyncMock()
 
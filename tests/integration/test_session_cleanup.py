@@ -18,13 +18,13 @@ class TestSessionCleanupOnCancel:
 
     @pytest.mark.asyncio
     @patch("apisbot.bot.handlers.start.session_service")
-    async def test_cancel_clears_session_data(self, mock_session_service):
+    async def test_cancel_clears_session_data(self, mock_session_service, test_user):
         """Test /cancel command clears session data."""
         # Arrange
         mock_session_service.clear_session = AsyncMock()
 
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.answer = AsyncMock()
 
         state = MagicMock(spec=FSMContext)
@@ -40,13 +40,13 @@ class TestSessionCleanupOnCancel:
 
     @pytest.mark.asyncio
     @patch("apisbot.bot.handlers.start.session_service")
-    async def test_cancel_with_no_state_does_not_clear_session(self, mock_session_service):
+    async def test_cancel_with_no_state_does_not_clear_session(self, mock_session_service, test_user):
         """Test /cancel without active state doesn't call clear_session."""
         # Arrange
         mock_session_service.clear_session = AsyncMock()
 
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.answer = AsyncMock()
 
         state = MagicMock(spec=FSMContext)
@@ -113,13 +113,13 @@ class TestPrivacyFirstPrinciple:
 
     @pytest.mark.asyncio
     @patch("apisbot.bot.handlers.start.session_service")
-    async def test_cancel_message_confirms_data_cleared(self, mock_session_service):
+    async def test_cancel_message_confirms_data_cleared(self, mock_session_service, test_user):
         """Test cancel message confirms to user that data is cleared."""
         # Arrange
         mock_session_service.clear_session = AsyncMock()
 
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.answer = AsyncMock()
 
         state = MagicMock(spec=FSMContext)
@@ -140,13 +140,13 @@ class TestSessionCleanupIntegrity:
 
     @pytest.mark.asyncio
     @patch("apisbot.bot.handlers.start.session_service")
-    async def test_multiple_cancels_safe(self, mock_session_service):
+    async def test_multiple_cancels_safe(self, mock_session_service, test_user):
         """Test multiple cancel calls are safe (idempotent)."""
         # Arrange
         mock_session_service.clear_session = AsyncMock()
 
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.answer = AsyncMock()
 
         state = MagicMock(spec=FSMContext)
@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from aiogram.fsm.context import FSMContext
-from aiogram.types import CallbackQuery, InlineKeyboardMarkup, Message, User
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup, Message
 
 from apisbot.bot.handlers.start import (
     cmd_help,
@@ -24,11 +24,11 @@ class TestStartMenuE2E:
     """End-to-end tests for /start menu."""
 
     @pytest.mark.asyncio
-    async def test_start_command_displays_chart_selection_menu(self):
+    async def test_start_command_displays_chart_selection_menu(self, test_user):
         """Test /start displays menu with Natal and Composite chart buttons."""
         # Arrange
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.answer = AsyncMock()
 
         state = MagicMock(spec=FSMContext)
@@ -57,11 +57,11 @@ class TestStartMenuE2E:
         assert isinstance(keyboard, InlineKeyboardMarkup)
 
     @pytest.mark.asyncio
-    async def test_start_menu_includes_help_button(self):
+    async def test_start_menu_includes_help_button(self, test_user):
         """Test /start menu includes help button."""
         # Arrange
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.answer = AsyncMock()
 
         state = MagicMock(spec=FSMContext)
@@ -89,11 +89,11 @@ class TestStartMenuE2E:
         assert help_button_found, "Help button not found in keyboard"
 
     @pytest.mark.asyncio
-    async def test_start_menu_includes_natal_chart_button(self):
+    async def test_start_menu_includes_natal_chart_button(self, test_user):
         """Test /start menu includes Natal Chart selection button."""
         # Arrange
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.answer = AsyncMock()
 
         state = MagicMock(spec=FSMContext)
@@ -118,11 +118,11 @@ class TestStartMenuE2E:
         assert natal_button_found, "Natal Chart button not found"
 
     @pytest.mark.asyncio
-    async def test_start_menu_includes_composite_chart_button(self):
+    async def test_start_menu_includes_composite_chart_button(self, test_user):
         """Test /start menu includes Composite Chart selection button."""
         # Arrange
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.answer = AsyncMock()
 
         state = MagicMock(spec=FSMContext)
@@ -151,11 +151,11 @@ class TestHelpDocumentationE2E:
     """End-to-end tests for help documentation system."""
 
     @pytest.mark.asyncio
-    async def test_help_command_displays_comprehensive_documentation(self):
+    async def test_help_command_displays_comprehensive_documentation(self, test_user):
         """Test /help command displays comprehensive help documentation."""
         # Arrange
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.answer = AsyncMock()
 
         # Act
@@ -184,11 +184,11 @@ class TestHelpDocumentationE2E:
         assert "30 minutes" in help_text or "session" in help_text.lower()
 
     @pytest.mark.asyncio
-    async def test_help_button_callback_shows_documentation(self):
+    async def test_help_button_callback_shows_documentation(self, test_user):
         """Test help button callback displays comprehensive documentation."""
         # Arrange
         callback = MagicMock(spec=CallbackQuery)
-        callback.from_user = User(id=123, is_bot=False, first_name="Test")
+        callback.from_user = test_user
         callback.message = MagicMock()
         callback.message.answer = AsyncMock()
         callback.answer = AsyncMock()
@@ -210,11 +210,11 @@ class TestHelpDocumentationE2E:
         assert "/start" in help_text
 
     @pytest.mark.asyncio
-    async def test_help_documentation_includes_chart_explanations(self):
+    async def test_help_documentation_includes_chart_explanations(self, test_user):
         """Test help documentation includes explanations of chart types."""
         # Arrange
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.answer = AsyncMock()
 
         # Act
@@ -229,11 +229,11 @@ class TestHelpDocumentationE2E:
         assert "relationship" in help_text.lower() or "compatibility" in help_text.lower()
 
     @pytest.mark.asyncio
-    async def test_help_documentation_includes_step_by_step_guide(self):
+    async def test_help_documentation_includes_step_by_step_guide(self, test_user):
         """Test help documentation includes step-by-step usage guide."""
         # Arrange
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.answer = AsyncMock()
 
         # Act
@@ -252,11 +252,11 @@ class TestInlineKeyboardHints:
     """Tests for inline keyboard command hints in various states."""
 
     @pytest.mark.asyncio
-    async def test_start_menu_message_mentions_help_availability(self):
+    async def test_start_menu_message_mentions_help_availability(self, test_user):
         """Test that start menu message mentions help is available."""
         # Arrange
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.answer = AsyncMock()
 
         state = MagicMock(spec=FSMContext)
@@ -293,7 +293,7 @@ class TestChartSelectionFlow:
 
     @pytest.mark.asyncio
     @patch("apisbot.bot.handlers.start.session_service")
-    async def test_natal_chart_selection_callback(self, mock_session_service):
+    async def test_natal_chart_selection_callback(self, mock_session_service, test_user):
         """Test selecting Natal Chart from menu starts natal flow."""
         # Arrange
         from apisbot.models.session import UserSession
@@ -302,7 +302,7 @@ class TestChartSelectionFlow:
         mock_session_service.get_or_create_session = AsyncMock(return_value=mock_session)
 
         callback = MagicMock(spec=CallbackQuery)
-        callback.from_user = User(id=123, is_bot=False, first_name="Test")
+        callback.from_user = test_user
         callback.data = f"chart_select:{ChartSelection.NATAL.value}"
         callback.message = MagicMock()
         callback.message.edit_text = AsyncMock()
@@ -323,7 +323,7 @@ class TestChartSelectionFlow:
 
     @pytest.mark.asyncio
     @patch("apisbot.bot.handlers.start.session_service")
-    async def test_composite_chart_selection_callback(self, mock_session_service):
+    async def test_composite_chart_selection_callback(self, mock_session_service, test_user):
         """Test selecting Composite Chart from menu starts composite flow."""
         # Arrange
         from apisbot.models.session import UserSession
@@ -332,7 +332,7 @@ class TestChartSelectionFlow:
         mock_session_service.get_or_create_session = AsyncMock(return_value=mock_session)
 
         callback = MagicMock(spec=CallbackQuery)
-        callback.from_user = User(id=123, is_bot=False, first_name="Test")
+        callback.from_user = test_user
         callback.data = f"chart_select:{ChartSelection.COMPOSITE.value}"
         callback.message = MagicMock()
         callback.message.edit_text = AsyncMock()
@@ -357,13 +357,13 @@ class TestSessionManagement:
 
     @pytest.mark.asyncio
     @patch("apisbot.bot.handlers.start.session_service")
-    async def test_start_command_clears_existing_session(self, mock_session_service):
+    async def test_start_command_clears_existing_session(self, mock_session_service, test_user):
         """Test /start clears any existing user session."""
         # Arrange
         mock_session_service.clear_session = AsyncMock()
 
         message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
+        message.from_user = test_user
         message.answer = AsyncMock()
 
         state = MagicMock(spec=FSMContext)
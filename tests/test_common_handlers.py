@@ -1,6 +1,8 @@
 """Tests for common handler helper functions."""
 
-from unittest.mock import patch
+from unittest.mock import MagicMock
+
+import pytest
 
 from apisbot.bot.handlers.common import (
     create_hint_keyboard,
@@ -12,38 +14,28 @@ from apisbot.bot.handlers.common import (
 class TestGetCommandHints:
     """Test get_command_hints function."""
 
-    @patch("apisbot.bot.handlers.common.MenuService")
-    def test_get_command_hints_with_hints(self, mock_menu_service):
-        """Test getting hints when hints are available."""
-        mock_menu_service.get_state_hints.return_value = [
-            "Use /help for assistance",
-            "Use /cancel to abort",
-        ]
+    @pytest.mark.parametrize(
+        "hints, expected",
+        [
+            (
+                ["Use /help for assistance", "Use /cancel to abort"],
+                "💡 Use /help for assistance\n💡 Use /cancel to abort",
+            ),
+            ([], ""),
+            (None, ""),
+        ],
+        ids=["with_hints", "no_hints", "none_returned"],
+    )
+    def test_get_command_hints(self, hints, expected, monkeypatch):
+        """Test hints are formatted one per line, or empty when the state has none."""
+        menu_service = MagicMock()
+        menu_service.get_state_hints.return_value = hints
+        monkeypatch.setattr("apisbot.bot.handlers.common.MenuService", menu_service)
 
         result = get_command_hints("date_entry")
 
-        assert "💡 Use /help for assistance" in result
-        assert "💡 Use /cancel to abort" in result
-        mock_menu_service.get_state_hints.assert_called_once_with("date_entry")
-
-    @patch("apisbot.bot.handlers.common.MenuService")
-    def test_get_command_hints_no_hints(self, mock_menu_service):
-        """Test getting hints when no hints are available."""
-        mock_menu_service.get_state_hints.return_value = []
-
-        result = get_command_hints("unknown_state")
-
-        assert result == ""
-        mock_menu_service.get_state_hints.assert_called_once_with("unknown_state")
-
-    @patch("apisbot.bot.handlers.common.MenuService")
-    def test_get_command_hints_none_returned(self, mock_menu_service):
-        """Test getting hints when None is returned."""
-        mock_menu_service.get_state_hints.return_value = None
-
-        result = get_command_hints("some_state")
-
-        assert result == ""
+        assert result == expected
+        menu_service.get_state_hints.assert_called_once_with("date_entry")
 
 
 class TestCreateHintKeyboard:
@@ -77,10 +69,10 @@ class TestCreateHintKeyboard:
 class TestGetStatePromptWithHints:
     """Test get_state_prompt_with_hints function."""
 
-    @patch("apisbot.bot.handlers.common.get_command_hints")
-    def test_get_state_prompt_with_hints(self, mock_get_hints):
+    def test_get_state_prompt_with_hints(self, monkeypatch):
         """Test getting prompt with hints appended."""
-        mock_get_hints.return_value = "💡 Use /help for assistance"
+        mock_get_hints = MagicMock(return_value="💡 Use /help for assistance")
+        monkeypatch.setattr("apisbot.bot.handlers.common.get_command_hints", mock_get_hints)
 
         result = get_state_prompt_with_hints("date_entry", "Enter your birth date:")
 
@@ -88,20 +80,20 @@ class TestGetStatePromptWithHints:
         assert "💡 Use /help for assistance" in result
         mock_get_hints.assert_called_once_with("date_entry")
 
-    @patch("apisbot.bot.handlers.common.get_command_hints")
-    def test_get_state_prompt_without_hints(self, mock_get_hints):
+    def test_get_state_prompt_without_hints(self, monkeypatch):
         """Test getting prompt when no hints are available."""
-        mock_get_hints.return_value = ""
+        mock_get_hints = MagicMock(return_value="")
+        monkeypatch.setattr("apisbot.bot.handlers.common.get_command_hints", mock_get_hints)
 
         result = get_state_prompt_with_hints("unknown_state", "Enter your data:")
 
         assert result == "Enter your data:"
         mock_get_hints.assert_called_once_with("unknown_state")
 
-    @patch("apisbot.bot.handlers.common.get_command_hints")
-    def test_get_state_prompt_formatting(self, mock_get_hints):
+    def test_get_state_prompt_formatting(self, monkeypatch):
         """Test that prompt and hints are properly formatted."""
-        mock_get_hints.return_value = "💡 Hint 1\n💡 Hint 2"
+        mock_get_hints = MagicMock(return_value="💡 Hint 1\n💡 Hint 2")
+        monkeypatch.setattr("apisbot.bot.handlers.common.get_command_hints", mock_get_hints)
 
         result = get_state_prompt_with_hints("test_state", "Test prompt")
 
@@ -1,11 +1,9 @@
 """Tests for composite_flow error paths to increase coverage."""
 
 from datetime import date, time
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from aiogram.fsm.context import FSMContext
-from aiogram.types import Message, User
 
 from apisbot.bot.handlers.composite_flow import (
     process_date_1,
@@ -18,340 +16,116 @@ from apisbot.bot.handlers.composite_flow import (
     process_time_2,
 )
 
+_COMPOSITE_DATA = {
+    "name_1": "Person One",
+    "birth_date_1": date(1990, 5, 15),
+    "birth_time_1": time(14, 30),
+    "location_1": "New York",
+    "name_2": "Person Two",
+    "birth_date_2": date(1985, 12, 25),
+    "birth_time_2": time(8, 0),
+    "location_2": "London",
+}
+_ALL_HANDLERS = [
+    process_name_1,
+    process_name_2,
+    process_date_1,
+    process_date_2,
+    process_time_1,
+    process_time_2,
+    process_location_1,
+    process_location_2,
+]
+_ALL_HANDLER_IDS = ["name_1", "name_2", "date_1", "date_2", "time_1", "time_2", "location_1", "location_2"]
+
 
 class TestCompositeFlowErrorPaths:
     """Test error handling in composite flow."""
 
-    @pytest.mark.asyncio
-    async def test_process_name_1_invalid(self):
-        """Test invalid name for person 1."""
-        message = MagicMock(spec=Message)
-        message.text = "123"  # No letters
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
-        state.update_data = AsyncMock()
-        state.set_state = AsyncMock()
-
-        await process_name_1(message, state)
-
-        state.update_data.assert_not_called()
-        message.answer.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_process_name_2_invalid(self):
-        """Test invalid name for person 2."""
-        message = MagicMock(spec=Message)
-        message.text = ""
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
-
-        await process_name_2(message, state)
-
-        message.answer.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_process_date_1_invalid(self):
-        """Test invalid date for person 1."""
-        message = MagicMock(spec=Message)
-        message.text = "invalid"
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
-        state.set_state = AsyncMock()
-
-        await process_date_1(message, state)
-
-        state.set_state.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_process_date_2_invalid(self):
-        """Test invalid date for person 2."""
-        message = MagicMock(spec=Message)
-        message.text = "not a date"
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
-
-        await process_date_2(message, state)
-
-        message.answer.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_process_time_1_invalid(self):
-        """Test invalid time for person 1."""
-        message = MagicMock(spec=Message)
-        message.text = "invalid"
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
-        state.set_state = AsyncMock()
-
-        await process_time_1(message, state)
-
-        state.set_state.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_process_time_2_invalid(self):
-        """Test invalid time for person 2."""
-        message = MagicMock(spec=Message)
-        message.text = "not a time"
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
-
-        await process_time_2(message, state)
-
-        message.answer.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_process_location_1_invalid(self):
-        """Test invalid location for person 1."""
-        message = MagicMock(spec=Message)
-        message.text = "A"  # Too short
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
-        state.update_data = AsyncMock()
-
-        await process_location_1(message, state)
-
-        state.update_data.assert_not_called()
-
-    @pytest.mark.asyncio
-    @patch("apisbot.bot.handlers.composite_flow.ChartService")
-    async def test_process_location_2_chart_error(self, mock_chart_class):
+    @pytest.mark.parametrize("handler", _ALL_HANDLERS, ids=_ALL_HANDLER_IDS)
+    async def test_no_text(self, handler, message_factory, fast_async, fake_state):
+        """Test every composite handler asks for a text message when there is none."""
+        message = message_factory(answer=fast_async)
+
+        await handler(message, fake_state)
+
+        assert message.answer.calls
+
+    @pytest.mark.parametrize(
+        "handler, text",
+        [
+            (process_name_1, "123"),  # No letters
+            (process_name_2, ""),
+            (process_date_1, "invalid"),
+            (process_date_2, "not a date"),
+            (process_time_1, "invalid"),
+            (process_time_2, "not a time"),
+            (process_location_1, "A"),  # Too short
+            (process_location_2, "X"),  # Too short
+        ],
+        ids=_ALL_HANDLER_IDS,
+    )
+    async def test_invalid(self, handler, text, message_factory, fast_async, fake_state):
+        """Test invalid input is rejected without touching the state."""
+        message = message_factory(text, answer=fast_async)
+
+        await handler(message, fake_state)
+
+        assert fake_state.update_data.calls == []
+        assert fake_state.set_state.calls == []
+        assert message.answer.calls
+
+    async def test_process_location_2_chart_error(self, monkeypatch, message_factory, state_factory, progress_message):
         """Test chart generation error for composite."""
         mock_chart_service = MagicMock()
         mock_chart_service.generate_composite = AsyncMock(
             side_effect=ValueError("Could not find location for first person")
         )
-        mock_chart_class.return_value = mock_chart_service
-
-        message = MagicMock(spec=Message)
-        message.text = "London"
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock(return_value=MagicMock(delete=AsyncMock()))
-
-        state = MagicMock(spec=FSMContext)
-        state.update_data = AsyncMock()
-        state.set_state = AsyncMock()
-        state.get_data = AsyncMock(
-            return_value={
-                "name_1": "Person One",
-                "birth_date_1": date(1990, 5, 15),
-                "birth_time_1": time(14, 30),
-                "location_1": "InvalidLocation",
-                "name_2": "Person Two",
-                "birth_date_2": date(1985, 12, 25),
-                "birth_time_2": time(8, 0),
-                "location_2": "London",
-            }
+        monkeypatch.setattr(
+            "apisbot.bot.handlers.composite_flow.ChartService", MagicMock(return_value=mock_chart_service)
         )
 
-        await process_location_2(message, state)
-
-        # Should handle error gracefully
-        message.answer.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_process_name_1_no_text(self):
-        """Test no text message for person 1."""
-        message = MagicMock(spec=Message)
-        message.text = None
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
-
-        await process_name_1(message, state)
-
-        message.answer.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_process_date_1_no_text(self):
-        """Test no text message for date 1."""
-        message = MagicMock(spec=Message)
-        message.text = None
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
-
-        await process_date_1(message, state)
-
-        message.answer.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_process_time_1_no_text(self):
-        """Test no text message for time 1."""
-        message = MagicMock(spec=Message)
-        message.text = None
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
+        message = message_factory("London", answer=AsyncMock(return_value=progress_message))
 
-        await process_time_1(message, state)
-
-        message.answer.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_process_location_1_no_text(self):
-        """Test no text message for location 1."""
-        message = MagicMock(spec=Message)
-        message.text = None
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
-
-        await process_location_1(message, state)
-
-        message.answer.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_process_name_2_no_text(self):
-        """Test no text message for person 2."""
-        message = MagicMock(spec=Message)
-        message.text = None
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
-
-        await process_name_2(message, state)
-
-        message.answer.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_process_date_2_no_text(self):
-        """Test no text message for date 2."""
-        message = MagicMock(spec=Message)
-        message.text = None
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
-
-        await process_date_2(message, state)
-
-        message.answer.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_process_time_2_no_text(self):
-        """Test no text message for time 2."""
-        message = MagicMock(spec=Message)
-        message.text = None
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
-
-        await process_time_2(message, state)
-
-        message.answer.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_process_location_2_no_text(self):
-        """Test no text message for location 2."""
-        message = MagicMock(spec=Message)
-        message.text = None
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
-
-        await process_location_2(message, state)
-
-        message.answer.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_process_location_2_too_short(self):
-        """Test location 2 that's too short."""
-        message = MagicMock(spec=Message)
-        message.text = "X"
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
+        state = state_factory(get_data=AsyncMock(return_value={**_COMPOSITE_DATA, "location_1": "InvalidLocation"}))
 
         await process_location_2(message, state)
 
+        # Should handle error gracefully
         message.answer.assert_called()
 
-    @pytest.mark.asyncio
-    @patch("apisbot.bot.handlers.composite_flow.ChartService")
-    async def test_process_location_2_generic_error(self, mock_chart_class):
+    async def test_process_location_2_generic_error(
+        self, monkeypatch, message_factory, state_factory, progress_message
+    ):
         """Test generic error during composite chart generation."""
         mock_chart_service = MagicMock()
         mock_chart_service.generate_composite = AsyncMock(side_effect=ValueError("Some other error"))
-        mock_chart_class.return_value = mock_chart_service
+        monkeypatch.setattr(
+            "apisbot.bot.handlers.composite_flow.ChartService", MagicMock(return_value=mock_chart_service)
+        )
 
-        message = MagicMock(spec=Message)
-        message.text = "London"
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock(return_value=MagicMock(delete=AsyncMock()))
+        message = message_factory("London", answer=AsyncMock(return_value=progress_message))
 
-        state = MagicMock(spec=FSMContext)
-        state.update_data = AsyncMock()
-        state.set_state = AsyncMock()
-        state.get_data = AsyncMock(
-            return_value={
-                "name_1": "Person One",
-                "birth_date_1": date(1990, 5, 15),
-                "birth_time_1": time(14, 30),
-                "location_1": "New York",
-                "name_2": "Person Two",
-                "birth_date_2": date(1985, 12, 25),
-                "birth_time_2": time(8, 0),
-                "location_2": "London",
-            }
-        )
-        state.clear = AsyncMock()
+        state = state_factory(get_data=AsyncMock(return_value=dict(_COMPOSITE_DATA)))
 
         await process_location_2(message, state)
 
         # Should clear state on generic error
         state.clear.assert_called()
 
-    @pytest.mark.asyncio
-    @patch("apisbot.bot.handlers.composite_flow.ChartService")
-    async def test_process_location_2_unexpected_error(self, mock_chart_class):
+    async def test_process_location_2_unexpected_error(
+        self, monkeypatch, message_factory, state_factory, progress_message
+    ):
         """Test unexpected exception during composite chart generation."""
         mock_chart_service = MagicMock()
         mock_chart_service.generate_composite = AsyncMock(side_effect=Exception("Unexpected error"))
-        mock_chart_class.return_value = mock_chart_service
+        monkeypatch.setattr(
+            "apisbot.bot.handlers.composite_flow.ChartService", MagicMock(return_value=mock_chart_service)
+        )
 
-        message = MagicMock(spec=Message)
-        message.text = "London"
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock(return_value=MagicMock(delete=AsyncMock()))
+        message = message_factory("London", answer=AsyncMock(return_value=progress_message))
 
-        state = MagicMock(spec=FSMContext)
-        state.update_data = AsyncMock()
-        state.set_state = AsyncMock()
-        state.get_data = AsyncMock(
-            return_value={
-                "name_1": "Person One",
-                "birth_date_1": date(1990, 5, 15),
-                "birth_time_1": time(14, 30),
-                "location_1": "New York",
-                "name_2": "Person Two",
-                "birth_date_2": date(1985, 12, 25),
-                "birth_time_2": time(8, 0),
-                "location_2": "London",
-            }
-        )
-        state.clear = AsyncMock()
+        state = state_factory(get_data=AsyncMock(return_value=dict(_COMPOSITE_DATA)))
 
         await process_location_2(message, state)
 
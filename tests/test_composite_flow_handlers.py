@@ -1,11 +1,9 @@
 """Tests for composite_flow handlers."""
 
 from datetime import date, time
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from aiogram.fsm.context import FSMContext
-from aiogram.types import Message, User
 
 from apisbot.bot.handlers.composite_flow import (
     process_date_1,
@@ -19,85 +17,52 @@ from apisbot.bot.handlers.composite_flow import (
 )
 from apisbot.bot.states import CompositeFlow
 
+_PERSON_1_DATA = {"name_1": "Person One", "birth_date_1": date(1990, 5, 15), "birth_time_1": time(14, 30)}
+_PERSON_2_DATA = {"name_2": "Person Two", "birth_date_2": date(1985, 12, 25), "birth_time_2": time(8, 0)}
 
-class TestCompositeFlowPerson1:
-    """Test composite flow handlers for person 1."""
-
-    @pytest.mark.asyncio
-    async def test_process_name_1(self):
-        """Test name input for person 1."""
-        message = MagicMock(spec=Message)
-        message.text = "Person One"
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
-        state.update_data = AsyncMock()
-        state.set_state = AsyncMock()
-
-        await process_name_1(message, state)
-
-        state.update_data.assert_called_once()
-        state.set_state.assert_called_once_with(CompositeFlow.waiting_for_date_1)
-
-    @pytest.mark.asyncio
-    async def test_process_date_1(self):
-        """Test date input for person 1."""
-        message = MagicMock(spec=Message)
-        message.text = "1990-05-15"
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
 
-        state = MagicMock(spec=FSMContext)
-        state.update_data = AsyncMock()
-        state.set_state = AsyncMock()
+class TestCompositeFlowSteps:
+    """Test the text step handlers shared by both persons."""
 
-        await process_date_1(message, state)
+    @pytest.mark.parametrize(
+        "handler, text, next_state",
+        [
+            (process_name_1, "Person One", CompositeFlow.waiting_for_date_1),
+            (process_date_1, "1990-05-15", CompositeFlow.waiting_for_time_1),
+            (process_time_1, "14:30", CompositeFlow.waiting_for_location_1),
+            (process_name_2, "Person Two", CompositeFlow.waiting_for_date_2),
+            (process_date_2, "1985-12-25", CompositeFlow.waiting_for_time_2),
+            (process_time_2, "08:00", CompositeFlow.waiting_for_location_2),
+        ],
+        ids=["name_1", "date_1", "time_1", "name_2", "date_2", "time_2"],
+    )
+    async def test_step(self, handler, text, next_state, message_factory, fast_async, fake_state):
+        """Test valid input is stored and advances to the next state."""
+        message = message_factory(text, answer=fast_async)
 
-        state.set_state.assert_called_once_with(CompositeFlow.waiting_for_time_1)
+        await handler(message, fake_state)
 
-    @pytest.mark.asyncio
-    async def test_process_time_1(self):
-        """Test time input for person 1."""
-        message = MagicMock(spec=Message)
-        message.text = "14:30"
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
+        assert len(fake_state.update_data.calls) == 1
+        assert fake_state.set_state.calls == [((next_state,), {})]
 
-        state = MagicMock(spec=FSMContext)
-        state.update_data = AsyncMock()
-        state.set_state = AsyncMock()
 
-        await process_time_1(message, state)
-
-        state.set_state.assert_called_once_with(CompositeFlow.waiting_for_location_1)
+class TestCompositeFlowPerson1:
+    """Test composite flow handlers for person 1."""
 
-    @pytest.mark.asyncio
-    @patch("apisbot.bot.handlers.composite_flow.AstrologicalSubjectFactory")
-    async def test_process_location_1(self, mock_subject_factory):
+    async def test_process_location_1(self, monkeypatch, message_factory, state_factory):
         """Test location input for person 1."""
         # Mock subject creation to succeed
         mock_subject = MagicMock()
         mock_subject.lat = 40.7128
         mock_subject.lng = -74.0060
         mock_subject.tz_str = "America/New_York"
+        mock_subject_factory = MagicMock()
+        monkeypatch.setattr("apisbot.bot.handlers.composite_flow.AstrologicalSubjectFactory", mock_subject_factory)
         mock_subject_factory.from_birth_data.return_value = mock_subject
 
-        message = MagicMock(spec=Message)
-        message.text = "New York"
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
-        state.update_data = AsyncMock()
-        state.set_state = AsyncMock()
-        state.get_data = AsyncMock(
-            return_value={
-                "name_1": "Person One",
-                "birth_date_1": date(1990, 5, 15),
-                "birth_time_1": time(14, 30),
-            }
-        )
+        message = message_factory("New York")
+
+        state = state_factory(get_data=AsyncMock(return_value=dict(_PERSON_1_DATA)))
 
         await process_location_1(message, state)
 
@@ -108,60 +73,7 @@ class TestCompositeFlowPerson1:
 class TestCompositeFlowPerson2:
     """Test composite flow handlers for person 2."""
 
-    @pytest.mark.asyncio
-    async def test_process_name_2(self):
-        """Test name input for person 2."""
-        message = MagicMock(spec=Message)
-        message.text = "Person Two"
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
-        state.update_data = AsyncMock()
-        state.set_state = AsyncMock()
-
-        await process_name_2(message, state)
-
-        state.update_data.assert_called_once()
-        state.set_state.assert_called_once_with(CompositeFlow.waiting_for_date_2)
-
-    @pytest.mark.asyncio
-    async def test_process_date_2(self):
-        """Test date input for person 2."""
-        message = MagicMock(spec=Message)
-        message.text = "1985-12-25"
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
-        state.update_data = AsyncMock()
-        state.set_state = AsyncMock()
-
-        await process_date_2(message, state)
-
-        state.set_state.assert_called_once_with(CompositeFlow.waiting_for_time_2)
-
-    @pytest.mark.asyncio
-    async def test_process_time_2(self):
-        """Test time input for person 2."""
-        message = MagicMock(spec=Message)
-        message.text = "08:00"
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
-
-        state = MagicMock(spec=FSMContext)
-        state.update_data = AsyncMock()
-        state.set_state = AsyncMock()
-
-        await process_time_2(message, state)
-
-        state.set_state.assert_called_once_with(CompositeFlow.waiting_for_location_2)
-
-    @pytest.mark.asyncio
-    @patch("apisbot.bot.handlers.composite_flow.AstrologicalSubjectFactory")
-    @patch("apisbot.bot.handlers.composite_flow.ChartService")
-    @patch("apisbot.bot.handlers.composite_flow.ConverterService")
-    async def test_process_location_2_success(self, mock_converter_class, mock_chart_class, mock_subject_factory):
+    async def test_process_location_2_success(self, monkeypatch, message_factory, state_factory, progress_message):
         """Test successful composite chart generation."""
         # Mock subject creation to succeed
         mock_subject_2 = MagicMock()
@@ -169,22 +81,26 @@ class TestCompositeFlowPerson2:
         mock_subject_2.lat = 51.5074
         mock_subject_2.lng = -0.1278
         mock_subject_2.tz_str = "Europe/London"
+        mock_subject_factory = MagicMock()
+        monkeypatch.setattr("apisbot.bot.handlers.composite_flow.AstrologicalSubjectFactory", mock_subject_factory)
         mock_subject_factory.from_birth_data.return_value = mock_subject_2
 
         # Setup mocks
         mock_chart_service = MagicMock()
         mock_chart_service.generate_composite = AsyncMock(return_value="<svg>composite chart</svg>")
-        mock_chart_class.return_value = mock_chart_service
+        monkeypatch.setattr(
+            "apisbot.bot.handlers.composite_flow.ChartService", MagicMock(return_value=mock_chart_service)
+        )
 
         mock_converter_service = MagicMock()
         mock_converter_service.svg_to_png = AsyncMock(return_value=b"PNG_DATA")
-        mock_converter_class.return_value = mock_converter_service
+        monkeypatch.setattr(
+            "apisbot.bot.handlers.composite_flow.ConverterService", MagicMock(return_value=mock_converter_service)
+        )
 
-        message = MagicMock(spec=Message)
-        message.text = "London, UK"
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock(return_value=MagicMock(delete=AsyncMock()))
-        message.answer_photo = AsyncMock()
+        message = message_factory(
+            "London, UK", answer=AsyncMock(return_value=progress_message), answer_photo=AsyncMock()
+        )
 
         # Create mock subject_1 (from first person's data)
         mock_subject_1 = MagicMock()
@@ -193,22 +109,11 @@ class TestCompositeFlowPerson2:
         mock_subject_1.lng = -74.0060
         mock_subject_1.tz_str = "America/New_York"
 
-        state = MagicMock(spec=FSMContext)
-        state.update_data = AsyncMock()
-        state.set_state = AsyncMock()
-        state.get_data = AsyncMock(
-            return_value={
-                "name_1": "Person One",
-                "birth_date_1": date(1990, 5, 15),
-                "birth_time_1": time(14, 30),
-                "location_1": "New York",
-                "subject_1": mock_subject_1,
-                "name_2": "Person Two",
-                "birth_date_2": date(1985, 12, 25),
-                "birth_time_2": time(8, 0),
-            }
+        state = state_factory(
+            get_data=AsyncMock(
+                return_value={**_PERSON_1_DATA, "location_1": "New York", "subject_1": mock_subject_1, **_PERSON_2_DATA}
+            )
         )
-        state.clear = AsyncMock()
 
         await process_location_2(message, state)
 
@@ -8,7 +8,6 @@ from apisbot.services.converter_service import ConverterService
 class TestConverterService:
     """Test ConverterService SVG to PNG conversion."""
 
-    @pytest.mark.asyncio
     async def test_svg_to_png_success(self):
         """Test successful SVG to PNG conversion."""
         # Simple valid SVG
@@ -24,7 +23,6 @@ class TestConverterService:
         # PNG files start with specific magic bytes
         assert png_bytes[:8] == b"\x89PNG\r\n\x1a\n"
 
-    @pytest.mark.asyncio
     async def test_svg_to_png_custom_dpi(self):
         """Test SVG to PNG conversion with custom DPI."""
         svg_data = """<?xml version="1.0" encoding="UTF-8"?>
@@ -42,17 +40,13 @@ class TestConverterService:
         assert png_low_dpi[:8] == b"\x89PNG\r\n\x1a\n"
         assert png_high_dpi[:8] == b"\x89PNG\r\n\x1a\n"
 
-    @pytest.mark.asyncio
-    async def test_svg_to_png_size_validation(self):
-        """Test that size limit constant is properly configured."""
-        # Verify the size limit constants
+    def test_max_size_constants(self):
+        """Test that the PNG size limit constants are properly configured."""
         assert ConverterService.MAX_SIZE_MB == 5
         assert ConverterService.MAX_SIZE_BYTES == 5 * 1024 * 1024
 
-        # Note: Actual size validation depends on cairosvg output which is hard to predict
-        # The converter will check size and raise ValueError if > 5MB
+        # Enforcement of the limit is covered with a stubbed oversized PNG in test_converter_service_errors.py
 
-    @pytest.mark.asyncio
     async def test_svg_to_png_invalid_svg(self):
         """Test handling of invalid SVG input."""
         invalid_svg = "This is not SVG"
@@ -60,13 +54,11 @@ class TestConverterService:
         with pytest.raises(ValueError, match="Failed to convert"):
             await ConverterService.svg_to_png(invalid_svg)
 
-    @pytest.mark.asyncio
     async def test_svg_to_png_empty_svg(self):
         """Test handling of empty SVG."""
         with pytest.raises(ValueError):
             await ConverterService.svg_to_png("")
 
-    @pytest.mark.asyncio
     async def test_svg_to_png_complex_chart(self):
         """Test conversion of a more complex SVG similar to natal charts."""
         # More complex SVG with paths and text
@@ -84,9 +76,3 @@ class TestConverterService:
         assert isinstance(png_bytes, bytes)
         assert len(png_bytes) > 1000  # Should be substantial
         assert png_bytes[:8] == b"\x89PNG\r\n\x1a\n"
-
-    @pytest.mark.asyncio
-    async def test_max_size_constants(self):
-        """Test that MAX_SIZE constants are set correctly."""
-        assert ConverterService.MAX_SIZE_MB == 5
-        assert ConverterService.MAX_SIZE_BYTES == 5 * 1024 * 1024
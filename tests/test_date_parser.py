@@ -11,6 +11,8 @@ from apisbot.services.date_parser import (
     suggest_time_format,
 )
 
+_TOO_OLD = date.today() - timedelta(days=201 * 365)
+
 
 class TestParseDate:
     """Test date parsing functionality."""
@@ -50,21 +52,29 @@ class TestParseDate:
         assert parse_date("  1990-05-15  ") == date(1990, 5, 15)
         assert parse_date(" 15/05/1990 ") == date(1990, 5, 15)
 
+    @pytest.mark.parametrize(
+        "impossible",
+        ["1990-02-30", "30/02/1990", "31-04-1990"],
+        ids=["iso_feb_30", "slash_feb_30", "dash_apr_31"],
+    )
+    def test_parse_date_impossible_day_raises_error(self, impossible):
+        """Test that well-formed but impossible dates raise ValueError."""
+        with pytest.raises(ValueError, match="day is out of range"):
+            parse_date(impossible)
+
     def test_parse_date_future_raises_error(self):
         """Test that future dates raise ValueError."""
-        tomorrow = date.today() + timedelta(days=1)
         with pytest.raises(ValueError, match="cannot be in the future"):
-            parse_date(tomorrow.strftime("%Y-%m-%d"))
+            parse_date((date.today() + timedelta(days=1)).strftime("%Y-%m-%d"))
 
     def test_parse_date_too_old_raises_error(self):
         """Test that dates older than 200 years raise ValueError."""
-        too_old = date.today() - timedelta(days=201 * 365)
         with pytest.raises(ValueError, match="cannot be more than 200 years ago"):
-            parse_date(too_old.strftime("%Y-%m-%d"))
+            parse_date(_TOO_OLD.strftime("%Y-%m-%d"))
 
-    def test_parse_date_invalid_format(self):
-        """Test that invalid formats raise ValueError."""
-        invalid_dates = [
+    @pytest.mark.parametrize(
+        "invalid_date",
+        [
             "not a date",
             "1990/05/15",  # Wrong separators
             "15.05.1990",
@@ -72,11 +82,12 @@ class TestParseDate:
             "May 1990",
             "32/01/1990",  # Invalid day
             "01/13/1990",  # Invalid month in DD/MM format
-        ]
-
-        for invalid_date in invalid_dates:
-            with pytest.raises(ValueError):
-                parse_date(invalid_date)
+        ],
+    )
+    def test_parse_date_invalid_format(self, invalid_date):
+        """Test that invalid formats raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_date(invalid_date)
 
 
 class TestParseTime:
@@ -140,20 +151,18 @@ class TestParseTime:
         with pytest.raises(ValueError, match="hours must be 1-12"):
             parse_time("13 PM")
 
-    def test_parse_time_invalid_format(self):
-        """Test that invalid formats raise ValueError."""
-        invalid_times = [
+    @pytest.mark.parametrize(
+        "invalid_time",
+        [
             "not a time",
             "14:30:45",  # Seconds not supported
-        ]
-
-        for invalid_time in invalid_times:
-            with pytest.raises(ValueError):
-                parse_time(invalid_time)
-
-        # Test invalid hour separately
+            "25",  # Invalid hour
+        ],
+    )
+    def test_parse_time_invalid_format(self, invalid_time):
+        """Test that invalid formats raise ValueError."""
         with pytest.raises(ValueError):
-            parse_time("25")
+            parse_time(invalid_time)
 
 
 class TestSuggestDateFormat:
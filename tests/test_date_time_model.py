@@ -1,26 +1,26 @@
 """Tests for DateTimeData model."""
 
-from datetime import date, datetime, time
+from datetime import date, datetime, time, timedelta
 
 import pytest
 
 from apisbot.models.date_time import DateTimeData
 
+_TODAY = date.today()
+_YR_200_AGO = date(_TODAY.year - 200, 1, 1)
+_YR_201_AGO = date(_TODAY.year - 201, 1, 1)
+
+# Shared by the read-only tests so the model validators run once instead of per test
+_DT_1990 = DateTimeData(birth_date=date(1990, 5, 15), birth_time=time(14, 30))
+
 
 class TestDateTimeData:
     """Test DateTimeData model validation and functionality."""
 
     def test_date_time_data_creation(self):
         """Test basic DateTimeData instantiation."""
-        dt_data = DateTimeData(
-            birth_date=date(1990, 5, 15),
-            birth_time=time(14, 30),
-        )
-
-        assert dt_data.birth_date == date(1990, 5, 15)
-        assert dt_data.birth_time == time(14, 30)
-        assert dt_data.display_date is not None
-        assert dt_data.display_time is not None
+        assert _DT_1990.birth_date == date(1990, 5, 15)
+        assert _DT_1990.birth_time == time(14, 30)
 
     def test_date_time_data_without_time(self):
         """Test DateTimeData with date only (no time)."""
@@ -51,62 +51,32 @@ class TestDateTimeData:
 
     def test_date_time_data_auto_display_time_format(self):
         """Test that display_time is auto-generated in HH:MM format."""
-        dt_data = DateTimeData(
-            birth_date=date(1990, 5, 15),
-            birth_time=time(14, 30),
-        )
-
-        assert dt_data.display_time == "14:30"
+        assert _DT_1990.display_time == "14:30"
 
-    def test_date_time_data_validates_future_date(self):
+    def test_date_time_data_rejects_future_date(self):
         """Test that future dates are rejected."""
-        from datetime import timedelta
-
-        future_date = date.today() + timedelta(days=1)
-
         with pytest.raises(ValueError, match="cannot be in the future"):
-            DateTimeData(birth_date=future_date)
+            DateTimeData(birth_date=date.today() + timedelta(days=1))
 
-    def test_date_time_data_validates_very_old_date(self):
+    def test_date_time_data_rejects_too_old_date(self):
         """Test that dates > 200 years ago are rejected."""
-        old_year = date.today().year - 201
-        old_date = date(old_year, 1, 1)
-
         with pytest.raises(ValueError, match="must be after year"):
-            DateTimeData(birth_date=old_date)
-
-    def test_date_time_data_accepts_today(self):
-        """Test that today's date is accepted."""
-        today = date.today()
-        dt_data = DateTimeData(birth_date=today)
+            DateTimeData(birth_date=_YR_201_AGO)
 
-        assert dt_data.birth_date == today
+    @pytest.mark.parametrize(
+        "birth_date",
+        [_TODAY, _YR_200_AGO],
+        ids=["today", "200_years_ago"],
+    )
+    def test_date_time_data_accepts_boundary_date(self, birth_date):
+        """Test that today and the date exactly 200 years ago are accepted."""
+        dt_data = DateTimeData(birth_date=birth_date)
 
-    def test_date_time_data_accepts_date_200_years_ago(self):
-        """Test that date exactly 200 years ago is accepted."""
-        boundary_year = date.today().year - 200
-        boundary_date = date(boundary_year, 1, 1)
-
-        dt_data = DateTimeData(birth_date=boundary_date)
-
-        assert dt_data.birth_date == boundary_date
+        assert dt_data.birth_date == birth_date
 
     def test_datetime_property_with_time(self):
         """Test datetime property returns combined datetime."""
-        dt_data = DateTimeData(
-            birth_date=date(1990, 5, 15),
-            birth_time=time(14, 30),
-        )
-
-        dt = dt_data.datetime
-
-        assert dt is not None
-        assert isinstance(dt, datetime)
-        assert dt.year == 1990
-        assert dt.month == 5
-        assert dt.day == 15
-        assert dt.hour == 14
-        assert dt.minute == 30
+        assert _DT_1990.datetime == datetime(1990, 5, 15, 14, 30)
 
     def test_datetime_property_without_time(self):
         """Test datetime property returns None when time is not set."""
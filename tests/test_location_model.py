@@ -38,110 +38,44 @@ class TestLocationData:
 
         assert loc_data.country == "United Kingdom"
 
-    def test_location_data_validates_latitude_too_high(self):
-        """Test that latitude > 90 is rejected."""
-        with pytest.raises(ValueError, match="Latitude must be between -90 and 90"):
+    @pytest.mark.parametrize(
+        "latitude, longitude, message",
+        [
+            (91.0, 0.0, "Latitude must be between -90 and 90"),
+            (-91.0, 0.0, "Latitude must be between -90 and 90"),
+            (0.0, 181.0, "Longitude must be between -180 and 180"),
+            (0.0, -181.0, "Longitude must be between -180 and 180"),
+        ],
+        ids=["latitude_too_high", "latitude_too_low", "longitude_too_high", "longitude_too_low"],
+    )
+    def test_location_data_rejects_out_of_range(self, latitude, longitude, message):
+        """Test that coordinates outside the valid range are rejected."""
+        with pytest.raises(ValueError, match=message):
             LocationData(
                 city="Invalid",
-                latitude=91.0,
-                longitude=0.0,
+                latitude=latitude,
+                longitude=longitude,
                 timezone="UTC",
                 display_name="Invalid Location",
             )
 
-    def test_location_data_validates_latitude_too_low(self):
-        """Test that latitude < -90 is rejected."""
-        with pytest.raises(ValueError, match="Latitude must be between -90 and 90"):
-            LocationData(
-                city="Invalid",
-                latitude=-91.0,
-                longitude=0.0,
-                timezone="UTC",
-                display_name="Invalid Location",
-            )
-
-    def test_location_data_validates_longitude_too_high(self):
-        """Test that longitude > 180 is rejected."""
-        with pytest.raises(ValueError, match="Longitude must be between -180 and 180"):
-            LocationData(
-                city="Invalid",
-                latitude=0.0,
-                longitude=181.0,
-                timezone="UTC",
-                display_name="Invalid Location",
-            )
-
-    def test_location_data_validates_longitude_too_low(self):
-        """Test that longitude < -180 is rejected."""
-        with pytest.raises(ValueError, match="Longitude must be between -180 and 180"):
-            LocationData(
-                city="Invalid",
-                latitude=0.0,
-                longitude=-181.0,
-                timezone="UTC",
-                display_name="Invalid Location",
-            )
-
-    def test_location_data_accepts_latitude_boundary_90(self):
-        """Test that latitude = 90 (North Pole) is accepted."""
-        loc_data = LocationData(
-            city="North Pole",
-            latitude=90.0,
-            longitude=0.0,
-            timezone="UTC",
-            display_name="North Pole",
-        )
-
-        assert loc_data.latitude == 90.0
-
-    def test_location_data_accepts_latitude_boundary_minus_90(self):
-        """Test that latitude = -90 (South Pole) is accepted."""
-        loc_data = LocationData(
-            city="South Pole",
-            latitude=-90.0,
-            longitude=0.0,
-            timezone="UTC",
-            display_name="South Pole",
-        )
-
-        assert loc_data.latitude == -90.0
-
-    def test_location_data_accepts_longitude_boundary_180(self):
-        """Test that longitude = 180 is accepted."""
-        loc_data = LocationData(
-            city="Date Line",
-            latitude=0.0,
-            longitude=180.0,
-            timezone="UTC",
-            display_name="International Date Line",
-        )
-
-        assert loc_data.longitude == 180.0
-
-    def test_location_data_accepts_longitude_boundary_minus_180(self):
-        """Test that longitude = -180 is accepted."""
-        loc_data = LocationData(
-            city="Date Line",
-            latitude=0.0,
-            longitude=-180.0,
-            timezone="UTC",
-            display_name="International Date Line",
-        )
-
-        assert loc_data.longitude == -180.0
-
-    def test_location_data_accepts_equator_prime_meridian(self):
-        """Test that coordinates (0, 0) are accepted."""
+    @pytest.mark.parametrize(
+        "latitude, longitude",
+        [(90.0, 0.0), (-90.0, 0.0), (0.0, 180.0), (0.0, -180.0), (0.0, 0.0)],
+        ids=["north_pole", "south_pole", "date_line_east", "date_line_west", "null_island"],
+    )
+    def test_location_data_accepts_boundaries(self, latitude, longitude):
+        """Test that coordinates on the edges of the valid range are accepted."""
         loc_data = LocationData(
-            city="Null Island",
-            latitude=0.0,
-            longitude=0.0,
+            city="Boundary",
+            latitude=latitude,
+            longitude=longitude,
             timezone="UTC",
-            display_name="Null Island",
+            display_name="Boundary Location",
         )
 
-        assert loc_data.latitude == 0.0
-        assert loc_data.longitude == 0.0
+        assert loc_data.latitude == latitude
+        assert loc_data.longitude == longitude
 
     def test_location_data_with_integer_coordinates(self):
         """Test that integer coordinates are accepted and stored as floats."""
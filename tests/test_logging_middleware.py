@@ -7,76 +7,63 @@ from aiogram.types import CallbackQuery, Chat, Message, Update, User
 
 from apisbot.bot.middlewares.logging_middleware import LoggingMiddleware
 
+_CHAT = Chat(id=456, type="private")
+_MESSAGE_UPDATE = Update(
+    update_id=1,
+    message=Message(
+        message_id=1, date=0, chat=_CHAT, from_user=User(id=123, is_bot=False, first_name="Test"), text="Hello"
+    ),
+)
+_COMMAND_UPDATE = Update(
+    update_id=1,
+    message=Message(
+        message_id=1,
+        date=0,
+        chat=Chat(id=789, type="private"),
+        from_user=User(id=456, is_bot=False, first_name="Test"),
+        text="/start",
+    ),
+)
+_ANONYMOUS_UPDATE = Update(update_id=1, message=Message(message_id=1, date=0, chat=_CHAT, text="Hello"))
+_CALLBACK_UPDATE = Update(
+    update_id=1,
+    callback_query=CallbackQuery(
+        id="test",
+        from_user=User(id=789, is_bot=False, first_name="Test"),
+        chat_instance="instance",
+        data="callback_data",
+    ),
+)
+
 
 class TestLoggingMiddleware:
     """Test LoggingMiddleware."""
 
-    @pytest.mark.asyncio
-    async def test_middleware_logs_message(self):
-        """Test that middleware logs regular messages."""
-        middleware = LoggingMiddleware()
-        handler = AsyncMock()
-
-        user = User(id=123, is_bot=False, first_name="Test")
-        chat = Chat(id=456, type="private")
-        message = Message(message_id=1, date=0, chat=chat, from_user=user, text="Hello")
-        update = Update(update_id=1, message=message)
-
-        with patch("apisbot.bot.middlewares.logging_middleware.logger") as mock_logger:
-            await middleware(handler, update, {})
-
-            mock_logger.info.assert_called()
-            call_args = str(mock_logger.info.call_args)
-            assert "123" in call_args
-            assert "message" in call_args
-
-    @pytest.mark.asyncio
-    async def test_middleware_logs_command(self):
-        """Test that middleware logs commands."""
-        middleware = LoggingMiddleware()
-        handler = AsyncMock()
-
-        user = User(id=456, is_bot=False, first_name="Test")
-        chat = Chat(id=789, type="private")
-        message = Message(message_id=1, date=0, chat=chat, from_user=user, text="/start")
-        update = Update(update_id=1, message=message)
-
-        with patch("apisbot.bot.middlewares.logging_middleware.logger") as mock_logger:
-            await middleware(handler, update, {})
-
-            mock_logger.info.assert_called()
-            call_args = str(mock_logger.info.call_args)
-            assert "456" in call_args
-            assert "command" in call_args
-
-    @pytest.mark.asyncio
-    async def test_middleware_logs_callback_query(self):
-        """Test that middleware logs callback queries."""
+    @pytest.mark.parametrize(
+        "update, expected_log",
+        [
+            (_MESSAGE_UPDATE, "User 123: received message"),
+            (_COMMAND_UPDATE, "User 456: received command"),
+            (_CALLBACK_UPDATE, "User 789: callback query"),
+        ],
+        ids=["message", "command", "callback_query"],
+    )
+    async def test_middleware_logs_update(self, update, expected_log):
+        """Test that middleware logs the sender and kind of each update."""
         middleware = LoggingMiddleware()
         handler = AsyncMock()
 
-        user = User(id=789, is_bot=False, first_name="Test")
-        callback = CallbackQuery(id="test", from_user=user, chat_instance="instance", data="callback_data")
-        update = Update(update_id=1, callback_query=callback)
-
         with patch("apisbot.bot.middlewares.logging_middleware.logger") as mock_logger:
             await middleware(handler, update, {})
 
-            mock_logger.info.assert_called()
-            call_args = str(mock_logger.info.call_args)
-            assert "789" in call_args
-            assert "callback" in call_args
+            mock_logger.info.assert_called_once_with(expected_log)
 
-    @pytest.mark.asyncio
     async def test_middleware_calls_handler(self):
         """Test that middleware calls the handler."""
         middleware = LoggingMiddleware()
         handler = AsyncMock(return_value="result")
 
-        user = User(id=123, is_bot=False, first_name="Test")
-        chat = Chat(id=456, type="private")
-        message = Message(message_id=1, date=0, chat=chat, from_user=user, text="Hello")
-        update = Update(update_id=1, message=message)
+        update = _MESSAGE_UPDATE
         data = {"key": "value"}
 
         result = await middleware(handler, update, data)
@@ -84,45 +71,30 @@ class TestLoggingMiddleware:
         handler.assert_called_once_with(update, data)
         assert result == "result"
 
-    @pytest.mark.asyncio
     async def test_middleware_logs_errors(self):
         """Test that middleware logs errors from handlers."""
         middleware = LoggingMiddleware()
         handler = AsyncMock(side_effect=ValueError("Test error"))
 
-        user = User(id=123, is_bot=False, first_name="Test")
-        chat = Chat(id=456, type="private")
-        message = Message(message_id=1, date=0, chat=chat, from_user=user, text="Hello")
-        update = Update(update_id=1, message=message)
+        update = _MESSAGE_UPDATE
 
         with patch("apisbot.bot.middlewares.logging_middleware.logger") as mock_logger:
             with pytest.raises(ValueError, match="Test error"):
                 await middleware(handler, update, {})
 
             # Check that error was logged
-            mock_logger.error.assert_called()
-            call_args = str(mock_logger.error.call_args)
-            assert "ValueError" in call_args
-            assert "Test error" in call_args
+            mock_logger.error.assert_called_once_with("Error processing update: ValueError: Test error", exc_info=True)
 
-    @pytest.mark.asyncio
     async def test_middleware_handles_message_without_user(self):
         """Test middleware handling message without user info."""
         middleware = LoggingMiddleware()
         handler = AsyncMock()
 
-        chat = Chat(id=456, type="private")
-        message = Message(message_id=1, date=0, chat=chat, text="Hello")
-        update = Update(update_id=1, message=message)
-
         with patch("apisbot.bot.middlewares.logging_middleware.logger") as mock_logger:
-            await middleware(handler, update, {})
+            await middleware(handler, _ANONYMOUS_UPDATE, {})
 
-            mock_logger.info.assert_called()
-            call_args = str(mock_logger.info.call_args)
-            assert "None" in call_args
+            mock_logger.info.assert_called_once_with("User None: received message")
 
-    @pytest.mark.asyncio
     async def test_middleware_handles_non_update_event(self):
         """Test middleware with non-Update event."""
         middleware = LoggingMiddleware()
@@ -1,14 +1,16 @@
 """Tests for __main__.py entry point."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from apisbot.__main__ import main
+
 
 class TestMain:
     """Test main entry point."""
 
-    @pytest.mark.asyncio
     @patch("apisbot.__main__.setup_dialogs")
     @patch("apisbot.__main__.get_birth_data_dialog")
     @patch("apisbot.__main__.set_start_commands")
@@ -27,8 +29,6 @@ class TestMain:
         mock_setup_dialogs,
     ):
         """Test that main() sets up bot correctly."""
-        from apisbot.__main__ import main
-
         # Mock settings
         mock_settings = MagicMock()
         mock_settings.bot_token = "test_token"
@@ -56,28 +56,19 @@ class TestMain:
         mock_dispatcher.update = MagicMock()
         mock_dispatcher.update.middleware = MagicMock()
         mock_dispatcher.resolve_used_update_types = MagicMock(return_value=[])
-        mock_dispatcher.start_polling = AsyncMock()
+        # Polling is the last step of main(), so cancelling it there leaves all setup done
+        mock_dispatcher.start_polling = AsyncMock(side_effect=asyncio.CancelledError)
         mock_dispatcher_class.return_value = mock_dispatcher
 
         # Mock dialog
         mock_dialog = MagicMock()
         mock_get_birth_data_dialog.return_value = mock_dialog
 
-        # Run main (it will try to start polling, so we'll let it set up then stop)
-        try:
-            # Create a task that we can cancel
-            import asyncio
-
-            task = asyncio.create_task(main())
-            # Give it a moment to set up
-            await asyncio.sleep(0.1)
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-        except Exception:
-            pass  # Expected since we're mocking
+        with pytest.raises(asyncio.CancelledError):
+            await main()
+
+        # The bot session is closed even when polling is cancelled
+        mock_bot.session.close.assert_awaited_once()
 
         # Verify bot was created with token
         mock_bot_class.assert_called_once()
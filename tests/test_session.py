@@ -1,11 +1,26 @@
 """Tests for UserSession model."""
 
-from datetime import datetime, timedelta
+from dataclasses import replace
+from datetime import date, datetime, time, timedelta
+
+import pytest
 
 from apisbot.models.birth_data import BirthData
 from apisbot.models.chart_selection import ChartSelection
 from apisbot.models.session import UserSession
 
+_STALE_TIME = datetime(2000, 1, 1)
+# Idle times around the default 1800-second timeout
+_EXPIRED_DELTA = timedelta(seconds=1860)
+_BOUNDARY_DELTA = timedelta(seconds=1800)
+_JUST_UNDER_DELTA = timedelta(seconds=1799)
+# Only read by the tests (clear() drops the references), so every test can share them
+_JOHN_BIRTH = BirthData(name="John Doe", birth_date=date(1990, 5, 15), birth_time=time(14, 30), location="New York")
+_JOHN_GEOCODED = replace(_JOHN_BIRTH, latitude=40.7128, longitude=-74.0060, timezone="America/New_York")
+_PERSON_1_BIRTH = replace(_JOHN_GEOCODED, name="Person One")
+_PERSON_2_BIRTH = BirthData(name="Person Two", birth_date=date(1985, 12, 25), birth_time=time(8, 0), location="London")
+_PERSON_2_GEOCODED = replace(_PERSON_2_BIRTH, latitude=51.5074, longitude=-0.1278, timezone="Europe/London")
+
 
 class TestUserSession:
     """Test UserSession model."""
@@ -31,15 +46,12 @@ class TestUserSession:
     def test_update_activity(self):
         """Test updating last activity timestamp."""
         session = UserSession(user_id=12345)
-        original_time = session.last_updated
+        # Backdate instead of sleeping so the clock is guaranteed to have moved on
+        session.last_updated = _STALE_TIME
 
-        # Wait a tiny bit and update
-        import time
-
-        time.sleep(0.01)
         session.update_activity()
 
-        assert session.last_updated > original_time
+        assert session.last_updated > _STALE_TIME
 
     def test_is_expired_not_expired(self):
         """Test is_expired returns False for recent session."""
@@ -48,192 +60,69 @@ class TestUserSession:
 
         assert not session.is_expired()
 
-    def test_is_expired_expired(self):
-        """Test is_expired returns True for old session."""
-        session = UserSession(user_id=12345)
-        # Set last_updated to 31 minutes ago (exceeds 30-minute default)
-        session.last_updated = datetime.now() - timedelta(seconds=1860)
-
-        assert session.is_expired()
-
-    def test_is_expired_at_boundary(self):
-        """Test is_expired at exact timeout boundary."""
-        session = UserSession(user_id=12345)
-        # Set last_updated to exactly 1800 seconds ago
-        session.last_updated = datetime.now() - timedelta(seconds=1800)
-
-        # At exact boundary (1800 seconds), code uses > so it IS expired
-        assert session.is_expired()
-
-    def test_is_expired_just_under_boundary(self):
-        """Test is_expired just under timeout boundary."""
-        session = UserSession(user_id=12345)
-        # Set last_updated to 1799 seconds ago (just under)
-        session.last_updated = datetime.now() - timedelta(seconds=1799)
-
-        assert not session.is_expired()
-
-    def test_is_complete_no_chart_type(self):
-        """Test is_complete returns False when chart type not selected."""
-        session = UserSession(user_id=12345)
-
-        assert not session.is_complete()
-
-    def test_is_complete_no_person1_data(self):
-        """Test is_complete returns False when person1_data is missing."""
-        session = UserSession(user_id=12345)
-        session.chart_type = ChartSelection.NATAL
-
-        assert not session.is_complete()
-
-    def test_is_complete_natal_chart_incomplete_data(self):
-        """Test is_complete returns False for natal chart with incomplete data."""
-        from datetime import date, time
-
-        session = UserSession(user_id=12345)
-        session.chart_type = ChartSelection.NATAL
-        session.person1_data = BirthData(
-            name="John Doe",
-            birth_date=date(1990, 5, 15),
-            birth_time=time(14, 30),
-            location="New York",
-            # Missing geocoding data
-        )
-
-        assert not session.is_complete()
-
-    def test_is_complete_natal_chart_complete_data(self):
-        """Test is_complete returns True for natal chart with complete data."""
-        from datetime import date, time
-
+    @pytest.mark.parametrize(
+        "idle, expected_expired",
+        [(_EXPIRED_DELTA, True), (_BOUNDARY_DELTA, True), (_JUST_UNDER_DELTA, False)],
+        ids=["expired", "at_boundary", "just_under_boundary"],
+    )
+    def test_is_expired_after_idle(self, idle, expected_expired):
+        """Test is_expired around the 1800-second timeout (the boundary itself counts as expired)."""
         session = UserSession(user_id=12345)
-        session.chart_type = ChartSelection.NATAL
-        session.person1_data = BirthData(
-            name="John Doe",
-            birth_date=date(1990, 5, 15),
-            birth_time=time(14, 30),
-            location="New York",
-            latitude=40.7128,
-            longitude=-74.0060,
-            timezone="America/New_York",
-        )
-
-        assert session.is_complete()
-
-    def test_is_complete_composite_chart_no_person2(self):
-        """Test is_complete returns False for composite chart without person2_data."""
-        from datetime import date, time
-
-        session = UserSession(user_id=12345)
-        session.chart_type = ChartSelection.COMPOSITE
-        session.person1_data = BirthData(
-            name="Person One",
-            birth_date=date(1990, 5, 15),
-            birth_time=time(14, 30),
-            location="New York",
-            latitude=40.7128,
-            longitude=-74.0060,
-            timezone="America/New_York",
-        )
-
-        assert not session.is_complete()
-
-    def test_is_complete_composite_chart_incomplete_person2(self):
-        """Test is_complete returns False for composite chart with incomplete person2_data."""
-        from datetime import date, time
-
-        session = UserSession(user_id=12345)
-        session.chart_type = ChartSelection.COMPOSITE
-        session.person1_data = BirthData(
-            name="Person One",
-            birth_date=date(1990, 5, 15),
-            birth_time=time(14, 30),
-            location="New York",
-            latitude=40.7128,
-            longitude=-74.0060,
-            timezone="America/New_York",
-        )
-        session.person2_data = BirthData(
-            name="Person Two",
-            birth_date=date(1985, 12, 25),
-            birth_time=time(8, 0),
-            location="London",
-            # Missing geocoding data
+        session.last_updated = datetime.now() - idle
+
+        assert session.is_expired() is expected_expired
+
+    @pytest.mark.parametrize(
+        "chart_type, person1_data, person2_data, expected",
+        [
+            (None, None, None, False),
+            (ChartSelection.NATAL, None, None, False),
+            (ChartSelection.NATAL, _JOHN_BIRTH, None, False),
+            (ChartSelection.NATAL, _JOHN_GEOCODED, None, True),
+            (ChartSelection.COMPOSITE, _PERSON_1_BIRTH, None, False),
+            (ChartSelection.COMPOSITE, _PERSON_1_BIRTH, _PERSON_2_BIRTH, False),
+            (ChartSelection.COMPOSITE, _PERSON_1_BIRTH, _PERSON_2_GEOCODED, True),
+        ],
+        ids=[
+            "no_chart_type",
+            "no_person1_data",
+            "natal_incomplete_data",
+            "natal_complete_data",
+            "composite_no_person2",
+            "composite_incomplete_person2",
+            "composite_complete_data",
+        ],
+    )
+    def test_is_complete(self, chart_type, person1_data, person2_data, expected):
+        """Test is_complete requires a chart type and geocoded birth data for every person it needs."""
+        session = UserSession(
+            user_id=12345, chart_type=chart_type, person1_data=person1_data, person2_data=person2_data
         )
 
-        assert not session.is_complete()
-
-    def test_is_complete_composite_chart_complete_data(self):
-        """Test is_complete returns True for composite chart with complete data."""
-        from datetime import date, time
-
-        session = UserSession(user_id=12345)
-        session.chart_type = ChartSelection.COMPOSITE
-        session.person1_data = BirthData(
-            name="Person One",
-            birth_date=date(1990, 5, 15),
-            birth_time=time(14, 30),
-            location="New York",
-            latitude=40.7128,
-            longitude=-74.0060,
-            timezone="America/New_York",
-        )
-        session.person2_data = BirthData(
-            name="Person Two",
-            birth_date=date(1985, 12, 25),
-            birth_time=time(8, 0),
-            location="London",
-            latitude=51.5074,
-            longitude=-0.1278,
-            timezone="Europe/London",
-        )
-
-        assert session.is_complete()
+        assert session.is_complete() is expected
 
     def test_clear_session(self):
         """Test clearing session data."""
-        from datetime import date, time
-
         session = UserSession(user_id=12345)
         session.chart_type = ChartSelection.NATAL
-        session.person1_data = BirthData(
-            name="John Doe",
-            birth_date=date(1990, 5, 15),
-            birth_time=time(14, 30),
-            location="New York",
-        )
-        original_last_updated = session.last_updated
+        session.person1_data = _JOHN_BIRTH
+        session.last_updated = _STALE_TIME
 
         # Clear session
-        import time as time_module
-
-        time_module.sleep(0.01)
         session.clear()
 
         # Verify all data cleared
         assert session.chart_type is None
         assert session.person1_data is None
         assert session.person2_data is None
-        assert session.last_updated > original_last_updated
+        assert session.last_updated > _STALE_TIME
 
     def test_clear_session_composite(self):
         """Test clearing composite chart session data."""
-        from datetime import date, time
-
         session = UserSession(user_id=12345)
         session.chart_type = ChartSelection.COMPOSITE
-        session.person1_data = BirthData(
-            name="Person One",
-            birth_date=date(1990, 5, 15),
-            birth_time=time(14, 30),
-            location="New York",
-        )
-        session.person2_data = BirthData(
-            name="Person Two",
-            birth_date=date(1985, 12, 25),
-            birth_time=time(8, 0),
-            location="London",
-        )
+        session.person1_data = _PERSON_1_BIRTH
+        session.person2_data = _PERSON_2_BIRTH
 
         session.clear()
 
@@ -1,10 +1,6 @@
 """Tests for start command handlers."""
 
-from unittest.mock import AsyncMock, MagicMock
-
-import pytest
-from aiogram.fsm.context import FSMContext
-from aiogram.types import Message, User
+from unittest.mock import AsyncMock
 
 from apisbot.bot.handlers.start import cmd_cancel, cmd_help, cmd_start
 
@@ -12,24 +8,19 @@ from apisbot.bot.handlers.start import cmd_cancel, cmd_help, cmd_start
 class TestStartHandler:
     """Test /start command handler."""
 
-    @pytest.mark.asyncio
-    async def test_cmd_start(self):
+    async def test_cmd_start(self, message_factory, fast_async, state_factory):
         """Test /start command."""
-        message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
+        message = message_factory("/start", answer=fast_async)
 
-        state = MagicMock(spec=FSMContext)
-        state.clear = AsyncMock()
-        state.set_state = AsyncMock()
+        state = state_factory()
 
         await cmd_start(message, state)
 
         state.clear.assert_called_once()
-        message.answer.assert_called_once()
+        assert len(message.answer.calls) == 1
 
         # Check welcome message content
-        call_args = message.answer.call_args[0][0]
+        call_args = message.answer.calls[0][0][0]
         assert "Welcome" in call_args
         assert "chart" in call_args.lower()
 
@@ -40,19 +31,16 @@ class TestStartHandler:
 class TestHelpHandler:
     """Test /help command handler."""
 
-    @pytest.mark.asyncio
-    async def test_cmd_help(self):
+    async def test_cmd_help(self, message_factory, fast_async):
         """Test /help command."""
-        message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
+        message = message_factory("/help", answer=fast_async)
 
         await cmd_help(message)
 
-        message.answer.assert_called_once()
+        assert len(message.answer.calls) == 1
 
         # Check help message content
-        call_args = message.answer.call_args[0][0]
+        call_args = message.answer.calls[0][0][0]
         assert "/start" in call_args
         assert "/help" in call_args
         assert "/cancel" in call_args
@@ -63,44 +51,34 @@ class TestHelpHandler:
 class TestCancelHandler:
     """Test /cancel command handler."""
 
-    @pytest.mark.asyncio
-    async def test_cmd_cancel_with_active_state(self):
+    async def test_cmd_cancel_with_active_state(self, message_factory, fast_async, state_factory):
         """Test /cancel with an active state."""
-        message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
+        message = message_factory("/cancel", answer=fast_async)
 
-        state = MagicMock(spec=FSMContext)
-        state.get_state = AsyncMock(return_value="SomeState:some_state")
-        state.clear = AsyncMock()
+        state = state_factory(get_state=AsyncMock(return_value="SomeState:some_state"))
 
         await cmd_cancel(message, state)
 
         state.get_state.assert_called_once()
         state.clear.assert_called_once()
-        message.answer.assert_called_once()
+        assert len(message.answer.calls) == 1
 
         # Check cancellation message
-        call_args = message.answer.call_args[0][0]
+        call_args = message.answer.calls[0][0][0]
         assert "cancel" in call_args.lower() or "cleared" in call_args.lower()
 
-    @pytest.mark.asyncio
-    async def test_cmd_cancel_without_active_state(self):
+    async def test_cmd_cancel_without_active_state(self, message_factory, fast_async, state_factory):
         """Test /cancel without an active state."""
-        message = MagicMock(spec=Message)
-        message.from_user = User(id=123, is_bot=False, first_name="Test")
-        message.answer = AsyncMock()
+        message = message_factory("/cancel", answer=fast_async)
 
-        state = MagicMock(spec=FSMContext)
-        state.get_state = AsyncMock(return_value=None)
-        state.clear = AsyncMock()
+        state = state_factory(get_state=AsyncMock(return_value=None))
 
         await cmd_cancel(message, state)
 
         state.get_state.assert_called_once()
         state.clear.assert_not_called()
-        message.answer.assert_called_once()
+        assert len(message.answer.calls) == 1
 
         # Check message indicates nothing to cancel
-        call_args = message.answer.call_args[0][0]
+        call_args = message.answer.calls[0][0][0]
         assert "nothing" in call_args.lower() or "no" in call_args.lower()
@@ -1,85 +1,53 @@
 """Tests for bot states."""
 
+import pytest
 from aiogram.fsm.state import State
 
 from apisbot.bot.states import ChartFlow, CompositeFlow
 
+_CHART_FLOW_STATES = (
+    "waiting_for_name",
+    "waiting_for_date",
+    "waiting_for_time",
+    "waiting_for_location",
+    "generating_chart",
+)
+_COMPOSITE_FLOW_STATES = (
+    "waiting_for_name_1",
+    "waiting_for_date_1",
+    "waiting_for_time_1",
+    "waiting_for_location_1",
+    "waiting_for_name_2",
+    "waiting_for_date_2",
+    "waiting_for_time_2",
+    "waiting_for_location_2",
+    "generating_composite_chart",
+)
+
 
 class TestChartFlow:
     """Test ChartFlow state definitions."""
 
-    def test_chart_flow_states_exist(self):
-        """Test that all ChartFlow states are defined."""
-        assert hasattr(ChartFlow, "waiting_for_name")
-        assert hasattr(ChartFlow, "waiting_for_date")
-        assert hasattr(ChartFlow, "waiting_for_time")
-        assert hasattr(ChartFlow, "waiting_for_location")
-        assert hasattr(ChartFlow, "generating_chart")
-
-    def test_chart_flow_states_are_state_objects(self):
-        """Test that ChartFlow states are State instances."""
-        assert isinstance(ChartFlow.waiting_for_name, State)
-        assert isinstance(ChartFlow.waiting_for_date, State)
-        assert isinstance(ChartFlow.waiting_for_time, State)
-        assert isinstance(ChartFlow.waiting_for_location, State)
-        assert isinstance(ChartFlow.generating_chart, State)
+    @pytest.mark.parametrize("name", _CHART_FLOW_STATES)
+    def test_chart_flow_state_defined(self, name):
+        """Test that each ChartFlow state is defined as a State instance."""
+        assert isinstance(getattr(ChartFlow, name, None), State)
 
     def test_chart_flow_states_unique(self):
         """Test that ChartFlow states are unique."""
-        states = [
-            ChartFlow.waiting_for_name,
-            ChartFlow.waiting_for_date,
-            ChartFlow.waiting_for_time,
-            ChartFlow.waiting_for_location,
-            ChartFlow.generating_chart,
-        ]
-
-        # Check that all state names are unique
-        state_names = [state.state for state in states]
+        state_names = [getattr(ChartFlow, name).state for name in _CHART_FLOW_STATES]
         assert len(state_names) == len(set(state_names))
 
 
 class TestCompositeFlow:
     """Test CompositeFlow state definitions."""
 
-    def test_composite_flow_states_exist(self):
-        """Test that all CompositeFlow states are defined."""
-        assert hasattr(CompositeFlow, "waiting_for_name_1")
-        assert hasattr(CompositeFlow, "waiting_for_date_1")
-        assert hasattr(CompositeFlow, "waiting_for_time_1")
-        assert hasattr(CompositeFlow, "waiting_for_location_1")
-        assert hasattr(CompositeFlow, "waiting_for_name_2")
-        assert hasattr(CompositeFlow, "waiting_for_date_2")
-        assert hasattr(CompositeFlow, "waiting_for_time_2")
-        assert hasattr(CompositeFlow, "waiting_for_location_2")
-        assert hasattr(CompositeFlow, "generating_composite_chart")
-
-    def test_composite_flow_states_are_state_objects(self):
-        """Test that CompositeFlow states are State instances."""
-        assert isinstance(CompositeFlow.waiting_for_name_1, State)
-        assert isinstance(CompositeFlow.waiting_for_date_1, State)
-        assert isinstance(CompositeFlow.waiting_for_time_1, State)
-        assert isinstance(CompositeFlow.waiting_for_location_1, State)
-        assert isinstance(CompositeFlow.waiting_for_name_2, State)
-        assert isinstance(CompositeFlow.waiting_for_date_2, State)
-        assert isinstance(CompositeFlow.waiting_for_time_2, State)
-        assert isinstance(CompositeFlow.waiting_for_location_2, State)
-        assert isinstance(CompositeFlow.generating_composite_chart, State)
+    @pytest.mark.parametrize("name", _COMPOSITE_FLOW_STATES)
+    def test_composite_flow_state_defined(self, name):
+        """Test that each CompositeFlow state is defined as a State instance."""
+        assert isinstance(getattr(CompositeFlow, name, None), State)
 
     def test_composite_flow_states_unique(self):
         """Test that CompositeFlow states are unique."""
-        states = [
-            CompositeFlow.waiting_for_name_1,
-            CompositeFlow.waiting_for_date_1,
-            CompositeFlow.waiting_for_time_1,
-            CompositeFlow.waiting_for_location_1,
-            CompositeFlow.waiting_for_name_2,
-            CompositeFlow.waiting_for_date_2,
-            CompositeFlow.waiting_for_time_2,
-            CompositeFlow.waiting_for_location_2,
-            CompositeFlow.generating_composite_chart,
-        ]
-
-        # Check that all state names are unique
-        state_names = [state.state for state in states]
+        state_names = [getattr(CompositeFlow, name).state for name in _COMPOSITE_FLOW_STATES]
         assert len(state_names) == len(set(state_names))
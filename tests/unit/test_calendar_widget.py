@@ -7,7 +7,22 @@ from datetime import date, timedelta
 
 import pytest
 
-from src.apisbot.bot.widgets.calendar import BIRTH_DATE_CALENDAR_CONFIG, CalendarWidget
+from src.apisbot.bot.widgets.calendar import BIRTH_DATE_CALENDAR_CONFIG, CalendarWidget, get_calendar_data
+
+# Read once at import, like BIRTH_DATE_CALENDAR_CONFIG itself, so both agree on "today"
+_TODAY = date.today()
+_FUTURE = _TODAY + timedelta(days=1)
+_OLD_199 = date(_TODAY.year - 199, 6, 15)
+_OLD_201 = date(_TODAY.year - 201, 1, 1)
+
+
+class _MockDialogManager:
+    """Stand-in for DialogManager exposing only the dialog_data the widget reads."""
+
+    __slots__ = ("dialog_data",)
+
+    def __init__(self, dialog_data=None):
+        self.dialog_data = dialog_data or {}
 
 
 class TestCalendarWidget:
@@ -16,13 +31,13 @@ class TestCalendarWidget:
     def test_calendar_config_has_min_max_dates(self):
         """Test that calendar config defines valid min/max date constraints."""
         # Verify min date is ~200 years ago
-        expected_min_year = date.today().year - 200
+        expected_min_year = _TODAY.year - 200
         assert BIRTH_DATE_CALENDAR_CONFIG.min_date.year == expected_min_year
         assert BIRTH_DATE_CALENDAR_CONFIG.min_date.month == 1
         assert BIRTH_DATE_CALENDAR_CONFIG.min_date.day == 1
 
         # Verify max date is today (no future dates)
-        assert BIRTH_DATE_CALENDAR_CONFIG.max_date == date.today()
+        assert BIRTH_DATE_CALENDAR_CONFIG.max_date == _TODAY
 
     def test_create_calendar_returns_calendar_widget(self):
         """Test that create_calendar returns a Calendar widget instance."""
@@ -42,47 +57,21 @@ class TestCalendarWidget:
         assert isinstance(calendar, Calendar)
         assert calendar.widget_id == "birth_date_calendar"
 
-    def test_is_valid_birth_date_accepts_today(self):
-        """Test that today's date is valid (edge case: born today)."""
-        today = date.today()
-
-        # Date within range [min_date, max_date]
-        assert BIRTH_DATE_CALENDAR_CONFIG.min_date <= today <= BIRTH_DATE_CALENDAR_CONFIG.max_date
-
-    def test_is_valid_birth_date_accepts_old_date(self):
-        """Test that very old dates (199 years ago) are valid."""
-        old_date = date(year=date.today().year - 199, month=6, day=15)
-
-        # Date within range
-        assert BIRTH_DATE_CALENDAR_CONFIG.min_date <= old_date <= BIRTH_DATE_CALENDAR_CONFIG.max_date
-
-    def test_is_valid_birth_date_rejects_future_date(self):
-        """Test that future dates are rejected (cannot be born in future)."""
-        future_date = date.today() + timedelta(days=1)
-
-        # Date outside max_date range
-        assert future_date > BIRTH_DATE_CALENDAR_CONFIG.max_date
-
-    def test_is_valid_birth_date_rejects_very_old_date(self):
-        """Test that dates > 200 years ago are rejected."""
-        very_old_date = date(year=date.today().year - 201, month=1, day=1)
-
-        # Date outside min_date range
-        assert very_old_date < BIRTH_DATE_CALENDAR_CONFIG.min_date
-
-    def test_is_valid_birth_date_boundary_min_date(self):
-        """Test that exactly min_date (200 years ago) is valid."""
-        min_date = BIRTH_DATE_CALENDAR_CONFIG.min_date
-
-        # Exactly at boundary
-        assert BIRTH_DATE_CALENDAR_CONFIG.min_date <= min_date <= BIRTH_DATE_CALENDAR_CONFIG.max_date
-
-    def test_is_valid_birth_date_boundary_max_date(self):
-        """Test that exactly max_date (today) is valid."""
-        max_date = BIRTH_DATE_CALENDAR_CONFIG.max_date
-
-        # Exactly at boundary
-        assert BIRTH_DATE_CALENDAR_CONFIG.min_date <= max_date <= BIRTH_DATE_CALENDAR_CONFIG.max_date
+    @pytest.mark.parametrize(
+        "candidate, in_range",
+        [
+            (_TODAY, True),
+            (_OLD_199, True),
+            (BIRTH_DATE_CALENDAR_CONFIG.min_date, True),
+            (BIRTH_DATE_CALENDAR_CONFIG.max_date, True),
+            (_FUTURE, False),
+            (_OLD_201, False),
+        ],
+        ids=["today", "199_years_ago", "min_date", "max_date", "future", "201_years_ago"],
+    )
+    def test_is_valid_birth_date_range(self, candidate, in_range):
+        """Test which dates fall inside the calendar's [min_date, max_date] range."""
+        assert (BIRTH_DATE_CALENDAR_CONFIG.min_date <= candidate <= BIRTH_DATE_CALENDAR_CONFIG.max_date) is in_range
 
 
 class TestCalendarDataStorage:
@@ -90,24 +79,14 @@ class TestCalendarDataStorage:
 
     def test_get_selected_date_returns_none_when_not_set(self):
         """Test that get_selected_date returns None when no date selected yet."""
-
-        # Mock DialogManager
-        class MockDialogManager:
-            dialog_data = {}
-
-        manager = MockDialogManager()
+        manager = _MockDialogManager()
         result = CalendarWidget.get_selected_date(manager)  # type: ignore
 
         assert result is None
 
     def test_get_selected_date_returns_stored_date(self):
         """Test that get_selected_date returns the stored date from dialog_data."""
-
-        # Mock DialogManager with stored date
-        class MockDialogManager:
-            dialog_data = {"selected_date": date(1990, 5, 15)}
-
-        manager = MockDialogManager()
+        manager = _MockDialogManager({"selected_date": date(1990, 5, 15)})
         result = CalendarWidget.get_selected_date(manager)  # type: ignore
 
         assert result == date(1990, 5, 15)
@@ -115,16 +94,7 @@ class TestCalendarDataStorage:
     @pytest.mark.asyncio
     async def test_get_calendar_data_returns_selected_date_display(self):
         """Test that get_calendar_data returns calendar data for dialog rendering."""
-        from src.apisbot.bot.widgets.calendar import get_calendar_data
-
-        # Mock DialogManager with selected date
-        class MockDialogManager:
-            dialog_data = {
-                "selected_date": date(1985, 12, 25),
-                "selected_date_display": "1985-12-25",
-            }
-
-        manager = MockDialogManager()
+        manager = _MockDialogManager({"selected_date": date(1985, 12, 25), "selected_date_display": "1985-12-25"})
         result = await get_calendar_data(manager)  # type: ignore
 
         assert result["selected_date"] == date(1985, 12, 25)
@@ -133,13 +103,7 @@ class TestCalendarDataStorage:
     @pytest.mark.asyncio
     async def test_get_calendar_data_default_display_when_not_selected(self):
         """Test that get_calendar_data returns default display when no date selected."""
-        from src.apisbot.bot.widgets.calendar import get_calendar_data
-
-        # Mock DialogManager without selected date
-        class MockDialogManager:
-            dialog_data = {}
-
-        manager = MockDialogManager()
+        manager = _MockDialogManager()
         result = await get_calendar_data(manager)  # type: ignore
 
         assert result["selected_date"] is None
@@ -4,73 +4,46 @@ Tests chart type validation and selection without bot dependencies.
 Validates US2 (chart selection routing).
 """
 
+from operator import attrgetter
+
 import pytest
 
 from apisbot.models.chart_selection import ChartSelection
 from apisbot.models.errors import ValidationError
 from apisbot.services.chart_selection_service import ChartSelectionService
 
+_CHART_PROPERTIES = attrgetter("display_name", "description", "required_birth_data_count")
+
 
 class TestChartSelectionService:
     """Test suite for ChartSelectionService."""
 
-    @pytest.mark.asyncio
-    async def test_select_chart_with_valid_natal_type(self) -> None:
-        """Test select_chart returns ChartSelection.NATAL for valid 'natal' input."""
-        result = await ChartSelectionService.select_chart(123, "natal")
-
-        assert isinstance(result, ChartSelection)
-        assert result == ChartSelection.NATAL
-
-    @pytest.mark.asyncio
-    async def test_select_chart_with_valid_composite_type(self) -> None:
-        """Test select_chart returns ChartSelection.COMPOSITE for valid 'composite' input."""
-        result = await ChartSelectionService.select_chart(123, "composite")
-
-        assert isinstance(result, ChartSelection)
-        assert result == ChartSelection.COMPOSITE
-
-    @pytest.mark.asyncio
-    async def test_select_chart_with_uppercase_input(self) -> None:
-        """Test select_chart handles uppercase input (case-insensitive)."""
-        result = await ChartSelectionService.select_chart(123, "NATAL")
-
-        assert isinstance(result, ChartSelection)
-        assert result == ChartSelection.NATAL
-
-    @pytest.mark.asyncio
-    async def test_select_chart_with_mixed_case_input(self) -> None:
-        """Test select_chart handles mixed case input."""
-        result = await ChartSelectionService.select_chart(123, "CoMpOsItE")
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("natal", ChartSelection.NATAL),
+            ("composite", ChartSelection.COMPOSITE),
+            ("NATAL", ChartSelection.NATAL),
+            ("CoMpOsItE", ChartSelection.COMPOSITE),
+        ],
+        ids=["lower_natal", "lower_composite", "upper_natal", "mixed_composite"],
+    )
+    async def test_select_chart_accepts(self, raw, expected) -> None:
+        """Test select_chart returns the matching ChartSelection regardless of case."""
+        result = await ChartSelectionService.select_chart(123, raw)
 
         assert isinstance(result, ChartSelection)
-        assert result == ChartSelection.COMPOSITE
-
-    @pytest.mark.asyncio
-    async def test_select_chart_with_invalid_type(self) -> None:
-        """Test select_chart returns ValidationError for invalid chart type."""
-        result = await ChartSelectionService.select_chart(123, "invalid_chart")
-
-        assert isinstance(result, ValidationError)
-        assert result.field_name == "chart_type"
-        assert "invalid_chart" in result.message.lower() or "unknown" in result.message.lower()
-        assert result.remediation is not None
-
-    @pytest.mark.asyncio
-    async def test_select_chart_with_empty_string(self) -> None:
-        """Test select_chart returns ValidationError for empty string."""
-        result = await ChartSelectionService.select_chart(123, "")
-
-        assert isinstance(result, ValidationError)
-        assert result.field_name == "chart_type"
+        assert result == expected
 
-    @pytest.mark.asyncio
-    async def test_select_chart_with_whitespace(self) -> None:
-        """Test select_chart returns ValidationError for whitespace."""
-        result = await ChartSelectionService.select_chart(123, "   ")
+    @pytest.mark.parametrize("raw", ["invalid_chart", "", "   "], ids=["unknown_type", "empty", "whitespace"])
+    async def test_select_chart_rejects(self, raw) -> None:
+        """Test select_chart returns ValidationError for unknown, empty and blank input."""
+        result = await ChartSelectionService.select_chart(123, raw)
 
         assert isinstance(result, ValidationError)
         assert result.field_name == "chart_type"
+        assert "unknown" in result.message.lower()
+        assert result.remediation
 
     def test_validate_chart_type_with_natal(self) -> None:
         """Test validate_chart_type returns ChartSelection.NATAL for 'natal'."""
@@ -153,33 +126,29 @@ class TestChartSelectionServiceNoAiogramDependencies:
 class TestChartSelectionValidationEdgeCases:
     """Test edge cases for chart selection validation."""
 
-    @pytest.mark.asyncio
     async def test_select_chart_with_special_characters(self) -> None:
         """Test select_chart handles special characters gracefully."""
         result = await ChartSelectionService.select_chart(123, "natal@#$%")
 
         assert isinstance(result, ValidationError)
 
-    @pytest.mark.asyncio
     async def test_select_chart_with_numeric_string(self) -> None:
         """Test select_chart handles numeric strings."""
         result = await ChartSelectionService.select_chart(123, "12345")
 
         assert isinstance(result, ValidationError)
 
-    def test_validate_chart_type_preserves_enum_properties(self) -> None:
+    @pytest.mark.parametrize(
+        "raw, display_name, birth_data_count",
+        [("natal", "Natal Chart", 1), ("composite", "Composite Chart", 2)],
+        ids=["natal", "composite"],
+    )
+    def test_validate_chart_type_preserves_enum_properties(self, raw, display_name, birth_data_count) -> None:
         """Test validated ChartSelection preserves enum properties."""
-        result = ChartSelectionService.validate_chart_type("natal")
-
-        assert isinstance(result, ChartSelection)
-        assert result.display_name == "Natal Chart"
-        assert result.description is not None
-        assert result.required_birth_data_count == 1
-
-    def test_validate_chart_type_composite_preserves_properties(self) -> None:
-        """Test validated Composite ChartSelection preserves properties."""
-        result = ChartSelectionService.validate_chart_type("composite")
+        result = ChartSelectionService.validate_chart_type(raw)
 
         assert isinstance(result, ChartSelection)
-        assert result.display_name == "Composite Chart"
-        assert result.required_birth_data_count == 2
+        name, description, count = _CHART_PROPERTIES(result)
+        assert name == display_name
+        assert description
+        assert count == birth_data_count